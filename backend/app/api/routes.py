@@ -1,9 +1,13 @@
+import hashlib
+import hmac
 import json
 import sys
 import importlib.metadata
 import json as jsonlib
 import subprocess
 import re
+import threading
+import time
 from collections import deque, Counter
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,7 +18,7 @@ from loguru import logger
 from sqlalchemy.orm import selectinload
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request, Query
 from fastapi.responses import FileResponse
-from sqlalchemy import text, select
+from sqlalchemy import text, select, update
 from sqlalchemy.orm import Session
 from ..core.database import get_session
 from ..core.config import get_settings, BASE_DIR
@@ -40,6 +44,8 @@ from ..schemas.common import (
     DownloaderTestResult,
     DownloaderSendRequest,
     DownloaderSendResult,
+    DownloaderCallback,
+    DownloaderCallbackResult,
     AuthLoginRequest,
     AuthLoginResponse,
     AuthMeResponse,
@@ -66,7 +72,7 @@ from ..schemas.common import (
 )
 from ..models.entities import Season, Round, Event, Indexer, Downloader, CachedSearch, ScheduledSearch
 from ..services.f1api import refresh_season
-from ..services.indexer_client import test_indexer_connection, search_indexer
+from ..services.indexer_client import test_indexer_connection, search_indexer, map_indexers, clear_search_cache
 from ..services.downloader_client import test_downloader_connection, send_to_downloader
 from ..services.auth import (
     ensure_auth_row,
@@ -91,7 +97,7 @@ from ..services.app_config import (
     save_notification_targets,
     _normalize_events,
 )
-from ..services.notifications import send_notifications
+from ..services.notifications import event_data, send_notifications
 from ..services.manual_downloads import record_manual_download
 
 router = APIRouter()
@@ -151,16 +157,16 @@ def _season_query(session: Session, include_deleted: bool = False):
 
 
 def _pause_season_searches(session: Session, season_id: int, reason: str) -> None:
-    searches = (
-        session.query(ScheduledSearch)
-        .join(Round, Round.id == ScheduledSearch.round_id)
-        .filter(Round.season_id == season_id)
-        .all()
+    # Rows claimed by a tick or manual run stay with the worker that owns them; the scheduler pauses
+    # searches of a hidden season itself on their next run.
+    session.execute(
+        update(ScheduledSearch)
+        .where(
+            ScheduledSearch.round_id.in_(select(Round.id).where(Round.season_id == season_id)),
+            ScheduledSearch.status != "running",
+        )
+        .values(status="paused", next_run_at=None, last_error=reason)
     )
-    for s in searches:
-        s.status = "paused"
-        s.next_run_at = None
-        s.last_error = reason
 
 
 def _restore_season_searches(session: Session, scheduler, season_id: int) -> None:
@@ -168,7 +174,7 @@ def _restore_season_searches(session: Session, scheduler, season_id: int) -> Non
     searches = (
         session.query(ScheduledSearch)
         .join(Round, Round.id == ScheduledSearch.round_id)
-        .filter(Round.season_id == season_id)
+        .filter(Round.season_id == season_id, ScheduledSearch.status != "running")
         .all()
     )
     for s in searches:
@@ -1295,8 +1301,8 @@ def search(
     all_results: list[SearchResult] = []
     seen_global: set[str | tuple[str, str]] = set()
     search_start = perf_counter()
-    for ix in indexers:
-        ix_results = _search_indexer_with_variants(ix, variants, limit)
+    per_indexer = map_indexers(lambda ix: _search_indexer_with_variants(ix, variants, limit), indexers)
+    for ix_results in per_indexer:
         for item in ix_results:
             key = item.nzb_url or (item.indexer.lower(), item.title.lower())
             if key in seen_global:
@@ -1333,6 +1339,8 @@ def _search_round_events(
     indexers: list[Indexer],
     allowlist: set[str],
     limit_per_query: int = 50,
+    *,
+    use_cache: bool = True,
 ) -> list[SearchResult]:
     results: list[SearchResult] = []
     seen: set[str | tuple[str, str]] = set()
@@ -1370,9 +1378,11 @@ def _search_round_events(
             if q not in queries:
                 queries.append(q)
 
-    for ix in indexers:
-        for q in queries:
-            batch = search_indexer(ix, q, limit=limit_per_query)
+    per_indexer = map_indexers(
+        lambda ix: [search_indexer(ix, q, limit=limit_per_query, use_cache=use_cache) for q in queries], indexers
+    )
+    for batches in per_indexer:
+        for batch in batches:
             for item in batch:
                 evt_type = _classify_event_type(item.title) or "other"
                 item.event_type = evt_type
@@ -1437,7 +1447,9 @@ def search_round(
     if not indexers:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No enabled indexers")
 
-    results = _search_round_events(round_obj.season, round_obj, indexers, allowlist, limit_per_query=50)
+    results = _search_round_events(
+        round_obj.season, round_obj, indexers, allowlist, limit_per_query=50, use_cache=not force
+    )
     _apply_scoring(results, cfg)
 
     # Upsert cache row
@@ -1503,7 +1515,9 @@ def auto_grab_round(
         indexers = session.query(Indexer).filter_by(enabled=True).order_by(Indexer.name.asc()).all()
         if not indexers:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No enabled indexers")
-        results = _search_round_events(round_obj.season, round_obj, indexers, allowlist, limit_per_query=50)
+        results = _search_round_events(
+            round_obj.season, round_obj, indexers, allowlist, limit_per_query=50, use_cache=not payload.force
+        )
         serialized = json.dumps([r.model_dump() for r in results])
         if cache:
             cache.results_json = serialized
@@ -1561,7 +1575,9 @@ def auto_grab_round(
                         message=f"Download started: {item.title} ({downloader.name})",
                         title="Racecarr",
                         event="download-start",
-                        data={"title": item.title, "downloader": downloader.name, "event": label},
+                        data=event_data(
+                            [{"title": item.title, "downloader": downloader.name, "reason": None, "label": label}]
+                        ),
                     )
             except Exception:
                 pass
@@ -1593,11 +1609,13 @@ def auto_grab_round(
 @router.get("/scheduler/searches", response_model=list[ScheduledSearchOut])
 def list_scheduled_searches(
     request: Request,
+    limit: int | None = Query(None, ge=1, description="Maximum number of searches to return"),
+    offset: int = Query(0, ge=0, description="Number of searches to skip"),
     session: Session = Depends(get_session),
     auth: AuthSession = Depends(require_auth),
 ) -> list[ScheduledSearchOut]:
     scheduler = _get_scheduler(request)
-    items = scheduler.list_searches(session)
+    items = scheduler.list_searches(session, limit=limit, offset=offset)
     log_response("scheduler_list", count=len(items))
     return items
 
@@ -1672,7 +1690,8 @@ async def run_scheduled_search(
     exists: ScheduledSearch | None = session.query(ScheduledSearch).filter_by(id=search_id).first()
     if not exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scheduled search not found")
-    await scheduler.run_now(search_id)
+    if not await scheduler.run_now(search_id):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Scheduled search is already running")
     session.expire_all()
     item: ScheduledSearch | None = session.query(ScheduledSearch).filter_by(id=search_id).first()
     if not item:
@@ -1802,6 +1821,7 @@ def update_indexer(
 
     session.commit()
     session.refresh(item)
+    clear_search_cache()
     log_response("update_indexer", id=item.id)
     return item
 
@@ -1813,6 +1833,7 @@ def delete_indexer(indexer_id: int, session: Session = Depends(get_session), aut
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Indexer not found")
     session.delete(item)
     session.commit()
+    clear_search_cache()
     log_response("delete_indexer", id=indexer_id)
     return None
 
@@ -1925,6 +1946,68 @@ def test_downloader(
     return DownloaderTestResult(ok=ok, message=message)
 
 
+# Signed callbacks older (or further in the future) than this are rejected; signatures seen inside
+# the window are remembered so the same request can't be replayed.
+_CALLBACK_MAX_AGE_SECONDS = 300
+_SEEN_CALLBACKS: dict[tuple[int, str], float] = {}
+_SEEN_CALLBACKS_LOCK = threading.Lock()
+
+
+def _valid_callback_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().lower().removeprefix("sha256="))
+
+
+def _first_callback_use(downloader_id: int, signature: str, sent_at: int) -> bool:
+    """Accept a fresh callback once; False when it is stale or its signature was already used."""
+    now = time.time()
+    if abs(now - sent_at) > _CALLBACK_MAX_AGE_SECONDS:
+        return False
+    key = (downloader_id, signature.strip().lower().removeprefix("sha256="))
+    with _SEEN_CALLBACKS_LOCK:
+        for stale in [k for k, expires in _SEEN_CALLBACKS.items() if expires < now]:
+            del _SEEN_CALLBACKS[stale]
+        if key in _SEEN_CALLBACKS:
+            return False
+        _SEEN_CALLBACKS[key] = sent_at + _CALLBACK_MAX_AGE_SECONDS
+    return True
+
+
+async def _raw_body(request: Request) -> bytes:
+    return await request.body()
+
+
+@router.post("/downloaders/{downloader_id}/callback", response_model=DownloaderCallbackResult)
+def downloader_callback(
+    downloader_id: int,
+    request: Request,
+    body: bytes = Depends(_raw_body),
+    session: Session = Depends(get_session),
+) -> DownloaderCallbackResult:
+    """Completion push from SABnzbd/NZBGet scripts; signed with HMAC-SHA256 of the body using the API key."""
+    item: Downloader | None = session.query(Downloader).filter_by(id=downloader_id, enabled=True).first()
+    signature = request.headers.get("X-Racecarr-Signature")
+    # Unknown ids and bad signatures get the same answer, so the endpoint doesn't reveal which ids exist.
+    secret = item.api_key if item and item.api_key else ""
+    if not _valid_callback_signature(secret, body, signature) or not secret:
+        logger.warning("downloader_callback_bad_signature", id=downloader_id)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid signature")
+    try:
+        payload = DownloaderCallback.model_validate_json(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid callback payload") from exc
+    if not _first_callback_use(downloader_id, signature, payload.timestamp):
+        logger.warning("downloader_callback_replayed", id=downloader_id, timestamp=payload.timestamp)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Stale or replayed callback")
+
+    scheduler = _get_scheduler(request)
+    outcome = scheduler.apply_download_callback(session, item, tag=payload.tag, status=payload.status)
+    log_response("downloader_callback", id=downloader_id, tag=payload.tag, status=payload.status, outcome=outcome)
+    return DownloaderCallbackResult(ok=outcome in {"completed", "failed"}, message=outcome)
+
+
 @router.post("/downloaders/{downloader_id}/send", response_model=DownloaderSendResult)
 def send_to_downloader_route(
     downloader_id: int,
@@ -1963,7 +2046,7 @@ def send_to_downloader_route(
                     message=f"Download started: {payload.title} ({item.name})",
                     title="Racecarr",
                     event="download-start",
-                    data={"title": payload.title, "downloader": item.name},
+                    data=event_data([{"title": payload.title, "downloader": item.name, "reason": None}]),
                 )
         except Exception:
             # Notification failures should not fail the send API
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     log_path: Path = Field(default_factory=lambda: DEFAULT_LOG_PATH, validation_alias="LOG_PATH")
     f1api_base_url: str = Field("https://f1api.dev", validation_alias="F1API_BASE_URL")
     scheduler_tick_seconds: int = Field(600, validation_alias="SCHEDULER_TICK_SECONDS")
+    # Installs with a downloader callback script can raise this; polling still catches everything else.
+    scheduler_poll_seconds: int = Field(600, validation_alias="SCHEDULER_POLL_SECONDS")
     enable_scheduler: bool = Field(True, validation_alias="ENABLE_SCHEDULER")
     allow_demo_seed: bool = Field(False, validation_alias="ALLOW_DEMO_SEED")
     auth_secret: str = Field("changeme-secret", validation_alias="AUTH_SECRET")
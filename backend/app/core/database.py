@@ -1,14 +1,34 @@
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import StaticPool
 from .config import get_settings
 
 settings = get_settings()
-settings.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
-engine = create_engine(
-    f"sqlite:///{settings.sqlite_path}", connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+if str(settings.sqlite_path) == ":memory:":
+    # One shared connection, so every session (and thread) sees the same in-memory database.
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+else:
+    settings.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(
+        f"sqlite:///{settings.sqlite_path}", connect_args={"check_same_thread": False}
+    )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _record) -> None:
+    # WAL lets readers run alongside a writer; NORMAL sync skips the per-commit fsync barrier.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# Keep loaded state after commit; handlers return the rows they just wrote without re-reading them.
+SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 Base = declarative_base()
 
 
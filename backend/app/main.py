@@ -43,6 +43,17 @@ def _ensure_scheduled_search_overrides() -> None:
             conn.execute(text(stmt))
 
 
+def _ensure_scheduled_search_claim_column() -> None:
+    inspector = inspect(engine)
+    if "scheduled_search" not in inspector.get_table_names():
+        return
+    cols = {col["name"] for col in inspector.get_columns("scheduled_search")}
+    if "claimed_at" in cols:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE scheduled_search ADD COLUMN claimed_at DATETIME"))
+
+
 def _ensure_season_soft_delete() -> None:
     inspector = inspect(engine)
     if "season" not in inspector.get_table_names():
@@ -54,6 +65,33 @@ def _ensure_season_soft_delete() -> None:
         conn.execute(text("ALTER TABLE season ADD COLUMN is_deleted BOOLEAN DEFAULT 0"))
 
 
+def _ensure_season_etag_column() -> None:
+    inspector = inspect(engine)
+    if "season" not in inspector.get_table_names():
+        return
+    cols = {col["name"] for col in inspector.get_columns("season")}
+    if "etag" in cols:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE season ADD COLUMN etag VARCHAR"))
+
+
+def _ensure_scheduled_search_indexes() -> None:
+    inspector = inspect(engine)
+    if "scheduled_search" not in inspector.get_table_names():
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_sched_status_next ON scheduled_search (status, next_run_at)")
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_sched_due ON scheduled_search (next_run_at) "
+                "WHERE status IN ('pending', 'failed')"
+            )
+        )
+
+
 def _ensure_notification_targets_column() -> None:
     inspector = inspect(engine)
     if "app_config" not in inspector.get_table_names():
@@ -101,7 +139,10 @@ def create_app() -> FastAPI:
     settings = get_settings()
     _ensure_downloader_priority_column()
     _ensure_scheduled_search_overrides()
+    _ensure_scheduled_search_claim_column()
+    _ensure_scheduled_search_indexes()
     _ensure_season_soft_delete()
+    _ensure_season_etag_column()
     _ensure_app_config_columns()
     Base.metadata.create_all(bind=engine)
     with SessionLocal() as session:
@@ -109,7 +150,7 @@ def create_app() -> FastAPI:
         app_config = ensure_app_config(session)
     configure_logging(app_config.log_level)
 
-    scheduler = SchedulerService(tick_seconds=settings.scheduler_tick_seconds, poll_seconds=settings.scheduler_tick_seconds)
+    scheduler = SchedulerService(tick_seconds=settings.scheduler_tick_seconds, poll_seconds=settings.scheduler_poll_seconds)
 
     app = FastAPI(title=settings.app_name)
     app.add_middleware(
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Text, UniqueConstraint
+from functools import cached_property
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Text, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 from ..core.database import Base
 
@@ -9,6 +10,7 @@ class Season(Base):
     year = Column(Integer, unique=True, nullable=False, index=True)
     last_refreshed = Column(DateTime, nullable=True)
     is_deleted = Column(Boolean, nullable=False, default=False)
+    etag = Column(String, nullable=True)
     rounds = relationship("Round", back_populates="season", cascade="all, delete-orphan")
 
 
@@ -43,6 +45,20 @@ class Indexer(Base):
     category = Column(String, nullable=True)
     enabled = Column(Boolean, default=True)
 
+    # Cached per loaded instance; rows are re-read per request, so edits are picked up next time.
+    @cached_property
+    def api_endpoint(self) -> str:
+        return self.api_url.rstrip("/") + "/api"
+
+    @cached_property
+    def base_params(self) -> dict[str, str]:
+        params: dict[str, str] = {}
+        if self.api_key:
+            params["apikey"] = self.api_key
+        if self.category:
+            params["cat"] = self.category
+        return params
+
 
 class Downloader(Base):
     __tablename__ = "downloader"
@@ -90,6 +106,15 @@ class ScheduledSearch(Base):
     __tablename__ = "scheduled_search"
     __table_args__ = (
         UniqueConstraint("round_id", "event_type", name="uq_scheduled_round_event"),
+        # Scheduler ticks/polls filter on status and next_run_at every pass.
+        Index("ix_sched_status_next", "status", "next_run_at"),
+        # Only rows the due scan can pick up, so it stays a short range scan as history grows.
+        Index(
+            "ix_sched_due",
+            "next_run_at",
+            sqlite_where=text("status IN ('pending', 'failed')"),
+            postgresql_where=text("status IN ('pending', 'failed')"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -106,6 +131,7 @@ class ScheduledSearch(Base):
     downloader_id = Column(Integer, ForeignKey("downloader.id"), nullable=True)
     event_start_utc = Column(DateTime, nullable=True)
     attempts = Column(Integer, nullable=False, default=0)
+    claimed_at = Column(DateTime, nullable=True)
     min_resolution = Column(Integer, nullable=True)
     max_resolution = Column(Integer, nullable=True)
     allow_hdr = Column(Boolean, nullable=True)
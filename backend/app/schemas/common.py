@@ -163,6 +163,18 @@ class DownloaderSendResult(BaseModel):
     message: str
 
 
+class DownloaderCallback(BaseModel):
+    tag: str
+    status: str
+    timestamp: int  # unix seconds when the script sent it; signed with the body for replay protection
+    title: str | None = None
+
+
+class DownloaderCallbackResult(BaseModel):
+    ok: bool
+    message: str
+
+
 class AuthLoginRequest(BaseModel):
     password: str
     remember_me: bool = False
@@ -1,9 +1,32 @@
+import atexit
 import httpx
+import threading
 import time
 from typing import Tuple, List, Dict
 from loguru import logger
 from ..models.entities import Downloader
 
+# Connect failures should surface quickly; reads get headroom above typical p95 latency.
+_FAST_TIMEOUT = httpx.Timeout(connect=2.0, read=5.0, write=2.0, pool=1.0)
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=2.0, read=10.0, write=2.0, pool=1.0)
+
+# Shared client so the health probe and the API call that follows reuse one connection;
+# HTTP/2 is negotiated for TLS hosts and falls back to HTTP/1.1 otherwise. The scheduler's concurrent
+# sends and history polls share it across ticks, so keep enough idle connections around for them.
+_CLIENT = httpx.Client(
+    http2=True,
+    timeout=_DEFAULT_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+)
+atexit.register(_CLIENT.close)
+
+# Short-lived history cache so overlapping pollers for the same downloader share one upstream call.
+# Keyed by downloader id; each entry keeps the limit it was fetched with so smaller limits are sliced from it.
+_HISTORY_TTL_SECONDS = 5.0
+_HISTORY_CACHE: dict[int, tuple[float, int, List[Dict[str, str]]]] = {}
+_HISTORY_LOCKS: dict[int, threading.Lock] = {}
+_HISTORY_LOCKS_GUARD = threading.Lock()
+
 
 class DownloaderError(Exception):
     pass
@@ -40,10 +63,80 @@ def send_to_downloader(
 def list_history(downloader: Downloader, limit: int = 50) -> List[Dict[str, str]]:
     dtype = _normalize_type(downloader.type)
     if dtype == "sabnzbd":
-        return _list_sabnzbd_history(downloader, limit)
-    if dtype == "nzbget":
-        return _list_nzbget_history(downloader, limit)
-    return []
+        fetch = _list_sabnzbd_history
+    elif dtype == "nzbget":
+        fetch = _list_nzbget_history
+    else:
+        return []
+
+    key = downloader.id
+    cached = _cached_history(key, limit)
+    if cached is not None:
+        return cached
+    with _HISTORY_LOCKS_GUARD:
+        lock = _HISTORY_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        # Another caller may have refreshed the entry while we waited on the lock.
+        cached = _cached_history(key, limit)
+        if cached is not None:
+            return cached
+        history = fetch(downloader, limit)
+        now = time.monotonic()
+        with _HISTORY_LOCKS_GUARD:
+            for stale in [k for k, (ts, _, _) in _HISTORY_CACHE.items() if now - ts >= _HISTORY_TTL_SECONDS]:
+                del _HISTORY_CACHE[stale]
+                if stale != key:
+                    _HISTORY_LOCKS.pop(stale, None)
+            _HISTORY_CACHE[key] = (now, limit, history)
+        return history
+
+
+def _cached_history(key: int, limit: int) -> List[Dict[str, str]] | None:
+    """Fresh cached history covering `limit` rows, or None when it has to be fetched."""
+    cached = _HISTORY_CACHE.get(key)
+    if not cached:
+        return None
+    fetched_at, fetched_limit, history = cached
+    if time.monotonic() - fetched_at >= _HISTORY_TTL_SECONDS:
+        return None
+    # A short page means the downloader has no more history, so any larger limit is covered too.
+    if limit > fetched_limit and len(history) >= fetched_limit:
+        return None
+    return history[:limit]
+
+
+def _json_body(resp: httpx.Response) -> dict | None:
+    """Decode a JSON API reply; reverse-proxy HTML/error pages are skipped without parsing."""
+    if "json" not in (resp.headers.get("content-type") or "").lower():
+        return None
+    return resp.json()
+
+
+def _probe_base_url(downloader: Downloader, dtype: str, label: str, started: float) -> str | None:
+    """Cheap HEAD against the base URL so dead or erroring hosts fail before the API call."""
+    try:
+        probe = _CLIENT.head(downloader.api_url, timeout=3)
+    except httpx.RequestError as exc:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader probe failed",
+            downloader=downloader.name,
+            type=dtype,
+            error=str(exc),
+            duration_ms=duration_ms,
+        )
+        return f"Request failed: {exc}"
+    if probe.status_code >= 500:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader probe server error",
+            downloader=downloader.name,
+            type=dtype,
+            status=probe.status_code,
+            duration_ms=duration_ms,
+        )
+        return f"HTTP {probe.status_code} from {label}"
+    return None
 
 
 def _test_sabnzbd(downloader: Downloader) -> Tuple[bool, str]:
@@ -52,8 +145,11 @@ def _test_sabnzbd(downloader: Downloader) -> Tuple[bool, str]:
     params = {"mode": "queue", "output": "json", "apikey": api_key}
     started = time.monotonic()
     logger.info("Downloader test start", downloader=downloader.name, type="sabnzbd", url=url)
+    probe_error = _probe_base_url(downloader, "sabnzbd", "SABnzbd", started)
+    if probe_error:
+        return False, probe_error
     try:
-        resp = httpx.get(url, params=params, timeout=10)
+        resp = _CLIENT.get(url, params=params, timeout=_FAST_TIMEOUT)
     except httpx.RequestError as exc:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -75,7 +171,17 @@ def _test_sabnzbd(downloader: Downloader) -> Tuple[bool, str]:
             duration_ms=duration_ms,
         )
         return False, f"HTTP {resp.status_code} from SABnzbd"
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader test non-JSON",
+            downloader=downloader.name,
+            type="sabnzbd",
+            content_type=resp.headers.get("content-type"),
+            duration_ms=duration_ms,
+        )
+        return False, "Non-JSON response from SABnzbd"
     if data.get("status") is False:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -122,7 +228,7 @@ def _send_sabnzbd(
         priority=priority,
     )
     try:
-        resp = httpx.get(url, params=params, timeout=10)
+        resp = _CLIENT.get(url, params=params)
     except httpx.RequestError as exc:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -145,7 +251,18 @@ def _send_sabnzbd(
             duration_ms=duration_ms,
         )
         return False, f"HTTP {resp.status_code} from SABnzbd add"
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader send non-JSON",
+            downloader=downloader.name,
+            type="sabnzbd",
+            title=title or nzb_url,
+            content_type=resp.headers.get("content-type"),
+            duration_ms=duration_ms,
+        )
+        return False, "Non-JSON response from SABnzbd"
     if data.get("status") is True:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.info(
@@ -177,8 +294,11 @@ def _test_nzbget(downloader: Downloader) -> Tuple[bool, str]:
         auth = (downloader.api_key, "")
     started = time.monotonic()
     logger.info("Downloader test start", downloader=downloader.name, type="nzbget", url=url)
+    probe_error = _probe_base_url(downloader, "nzbget", "NZBGet", started)
+    if probe_error:
+        return False, probe_error
     try:
-        resp = httpx.post(url, json=payload, timeout=10, auth=auth)
+        resp = _CLIENT.post(url, json=payload, timeout=_FAST_TIMEOUT, auth=auth)
     except httpx.RequestError as exc:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -200,7 +320,17 @@ def _test_nzbget(downloader: Downloader) -> Tuple[bool, str]:
             duration_ms=duration_ms,
         )
         return False, f"HTTP {resp.status_code} from NZBGet"
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader test non-JSON",
+            downloader=downloader.name,
+            type="nzbget",
+            content_type=resp.headers.get("content-type"),
+            duration_ms=duration_ms,
+        )
+        return False, "Non-JSON response from NZBGet"
     if data.get("error"):
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -254,7 +384,7 @@ def _send_nzbget(
         priority=priority,
     )
     try:
-        resp = httpx.post(url, json=payload, timeout=10, auth=auth)
+        resp = _CLIENT.post(url, json=payload, auth=auth)
     except httpx.RequestError as exc:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -277,7 +407,18 @@ def _send_nzbget(
             duration_ms=duration_ms,
         )
         return False, f"HTTP {resp.status_code} from NZBGet appendurl"
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "Downloader send non-JSON",
+            downloader=downloader.name,
+            type="nzbget",
+            title=name,
+            content_type=resp.headers.get("content-type"),
+            duration_ms=duration_ms,
+        )
+        return False, "Non-JSON response from NZBGet"
     if data.get("error"):
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -322,13 +463,15 @@ def _list_sabnzbd_history(downloader: Downloader, limit: int) -> List[Dict[str,
         "limit": max(1, min(limit, 200)),
     }
     try:
-        resp = httpx.get(url, params=params, timeout=10)
+        resp = _CLIENT.get(url, params=params)
     except httpx.RequestError as exc:
         logger.debug("SABnzbd history request failed", name=downloader.name, error=str(exc))
         return []
     if resp.status_code != 200:
         return []
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        return []
     slots = (data.get("history") or {}).get("slots") or []
     history: List[Dict[str, str]] = []
     for slot in slots:
@@ -345,13 +488,15 @@ def _list_nzbget_history(downloader: Downloader, limit: int) -> List[Dict[str, s
     if downloader.api_key:
         auth = (downloader.api_key, "")
     try:
-        resp = httpx.post(url, json=payload, timeout=10, auth=auth)
+        resp = _CLIENT.post(url, json=payload, auth=auth)
     except httpx.RequestError as exc:
         logger.debug("NZBGet history request failed", name=downloader.name, error=str(exc))
         return []
     if resp.status_code != 200:
         return []
-    data = resp.json()
+    data = _json_body(resp)
+    if data is None:
+        return []
     items = data.get("result") or []
     history: List[Dict[str, str]] = []
     for entry in items:
@@ -1,14 +1,20 @@
+import atexit
 import time
 from datetime import datetime
 from typing import Any
 import httpx
 from fastapi import HTTPException, status
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 from loguru import logger
 
 from ..core.config import get_settings
 from ..models.entities import Season, Round, Event
 
+_CLIENT = httpx.Client(http2=True, timeout=httpx.Timeout(connect=2.0, read=15.0, write=2.0, pool=1.0))
+atexit.register(_CLIENT.close)
+_EMPTY: dict[str, Any] = {}
+
 
 def _parse_dt(value: str | None) -> datetime | None:
     if not value:
@@ -57,14 +63,35 @@ def _extract_events(schedule: dict[str, Any]) -> list[dict[str, Any]]:
     return events
 
 
+# Stored ETags carry the parser version, so a season last parsed by older mapping code is refetched in full
+# instead of being answered 304. Bump when _extract_events or the round mapping below changes.
+_PARSER_VERSION = 2
+_ETAG_PREFIX = f"v{_PARSER_VERSION}:"
+
+
+def _fetch_races(url: str, etag: str | None) -> tuple[int, str | None, list[dict[str, Any]] | None]:
+    headers = {"If-None-Match": etag} if etag else {}
+    resp = _CLIENT.get(url, headers=headers)
+    if resp.status_code == 304:
+        return resp.status_code, etag, None
+    resp.raise_for_status()
+    content_type = (resp.headers.get("content-type") or "").lower()
+    if "json" not in content_type:
+        logger.warning("f1api_fetch_non_json", url=url, content_type=content_type)
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"f1api returned non-JSON response for {url}")
+    return resp.status_code, resp.headers.get("ETag"), resp.json().get("races", [])
+
+
 def refresh_season(session: Session, year: int) -> Season:
     settings = get_settings()
     url = f"{settings.f1api_base_url}/api/{year}"
     started = time.monotonic()
+    season: Season | None = session.query(Season).filter_by(year=year).first()
+    stored = season.etag if season else None
+    known_etag = stored.removeprefix(_ETAG_PREFIX) if stored and stored.startswith(_ETAG_PREFIX) else None
     logger.info("f1api_fetch_start", url=url, year=year)
     try:
-        resp = httpx.get(url, timeout=15)
-        resp.raise_for_status()
+        status_code, etag, races = _fetch_races(url, known_etag)
     except httpx.HTTPStatusError as exc:
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.warning(
@@ -81,19 +108,28 @@ def refresh_season(session: Session, year: int) -> Season:
         logger.warning("f1api_fetch_failed", url=url, year=year, error=str(exc), duration_ms=duration_ms)
         detail = f"f1api request failed for {url}: {exc}"
         raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=detail) from exc
-    payload = resp.json()
-    races = payload.get("races", [])
+
+    if races is None and season:
+        # Upstream schedule unchanged since the last refresh; keep existing rounds/events.
+        season.is_deleted = False
+        season.last_refreshed = datetime.utcnow()
+        session.commit()
+        session.refresh(season)
+        duration_ms = int((time.monotonic() - started) * 1000)
+        logger.info("f1api_fetch_not_modified", url=url, year=year, duration_ms=duration_ms)
+        return season
+    races = races or []
+
     duration_ms = int((time.monotonic() - started) * 1000)
     logger.info(
         "f1api_fetch_ok",
         url=url,
         year=year,
-        status=resp.status_code,
+        status=status_code,
         races=len(races),
         duration_ms=duration_ms,
     )
 
-    season: Season | None = session.query(Season).filter_by(year=year).first()
     if not season:
         season = Season(year=year)
         session.add(season)
@@ -102,22 +138,26 @@ def refresh_season(session: Session, year: int) -> Season:
     # Refreshing should unhide the season if it was previously hidden.
     season.is_deleted = False
 
-    # Clear existing rounds/events for this season
-    season.rounds.clear()
-    session.flush()
+    # Clear existing rounds/events for this season with two set-based deletes instead of per-row ORM deletes.
+    season_round_ids = select(Round.id).where(Round.season_id == season.id)
+    session.execute(delete(Event).where(Event.round_id.in_(season_round_ids)))
+    session.execute(delete(Round).where(Round.season_id == season.id))
+    session.expire(season, ["rounds"])
 
     event_count = 0
     for race in races:
-        round_number = int(race.get("round", 0)) if race.get("round") else 0
+        round_value = race.get("round")
+        round_number = int(round_value) if round_value else 0
+        circuit = race.get("circuit") or _EMPTY
         round_obj = Round(
             season_id=season.id,
             round_number=round_number,
             name=race.get("raceName") or race.get("name") or f"Round {round_number}",
-            circuit=(race.get("circuit") or {}).get("circuitName") or (race.get("circuit") or {}).get("name"),
-            country=(race.get("circuit") or {}).get("country"),
+            circuit=circuit.get("circuitName") or circuit.get("name"),
+            country=circuit.get("country"),
         )
 
-        schedule = race.get("schedule") or {}
+        schedule = race.get("schedule") or _EMPTY
         for ev in _extract_events(schedule):
             round_obj.events.append(
                 Event(
@@ -130,6 +170,7 @@ def refresh_season(session: Session, year: int) -> Season:
 
         season.rounds.append(round_obj)
 
+    season.etag = f"{_ETAG_PREFIX}{etag}" if etag else None
     season.last_refreshed = datetime.utcnow()
     session.commit()
     session.refresh(season)
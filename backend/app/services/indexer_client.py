@@ -1,50 +1,129 @@
+import atexit
+import hashlib
+import threading
 import httpx
 from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from time import perf_counter
+from time import monotonic, perf_counter
+from typing import Callable, Sequence, TypeVar
 from xml.etree import ElementTree as ET
 
 from ..models.entities import Indexer
 from ..schemas.common import SearchResult
 
+_CHUNK_SIZE = 65536
+_SNIPPET_BYTES = 500
+_PROBE_BYTES = 8192
+_CAPS_MARKERS = (b"<caps", b"<newznab", b"<error")
+_SEARCH_MARKERS = (b"</item>", b"<error")
+_MAX_PARALLEL_INDEXERS = 8
+_MB = 1.0 / (1024 * 1024)
 
-def _build_api_url(base_url: str) -> str:
-    base = base_url.rstrip("/")
-    return f"{base}/api"
+# Keep-alive client shared by caps probes and searches so repeat calls skip the TCP/TLS handshake.
+_CLIENT = httpx.Client(http2=True, timeout=10, limits=httpx.Limits(max_keepalive_connections=8))
+atexit.register(_CLIENT.close)
+
+# Recent search results keyed by request fingerprint, so repeated UI/scheduler searches skip the network.
+_SEARCH_CACHE_TTL_SECONDS = 300.0
+_SEARCH_CACHE_MAX_ENTRIES = 256
+_SEARCH_CACHE: dict[bytes, tuple[float, list[SearchResult]]] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+# Caches layered on top of search results (e.g. the scheduler's per-round cache) register here to be cleared too.
+_DERIVED_CACHE_CLEARERS: list[Callable[[], None]] = []
+
+T = TypeVar("T")
+
+
+def _search_cache_key(url: str, params: dict[str, str]) -> bytes:
+    return hashlib.sha256(repr((url, sorted(params.items()))).encode()).digest()
+
+
+def _search_cache_get(key: bytes) -> list[SearchResult] | None:
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+    if not entry or monotonic() - entry[0] > _SEARCH_CACHE_TTL_SECONDS:
+        return None
+    # Callers annotate results in place (event type, score), so hand out copies.
+    return [item.model_copy() for item in entry[1]]
+
+
+def _search_cache_put(key: bytes, items: list[SearchResult]) -> None:
+    now = monotonic()
+    with _SEARCH_CACHE_LOCK:
+        if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (ts, _) in _SEARCH_CACHE.items() if now - ts > _SEARCH_CACHE_TTL_SECONDS]:
+                del _SEARCH_CACHE[stale]
+            if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX_ENTRIES:
+                del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+        _SEARCH_CACHE[key] = (now, [item.model_copy() for item in items])
+
+
+def register_search_cache_clearer(clear: Callable[[], None]) -> None:
+    """Have `clear_search_cache` also drop a cache built from indexer search results."""
+    _DERIVED_CACHE_CLEARERS.append(clear)
+
+
+def clear_search_cache() -> None:
+    """Drop cached indexer search results (indexer edited/removed or user forced a reload)."""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+    for clear in _DERIVED_CACHE_CLEARERS:
+        clear()
+
+
+def _read_probe_head(resp: httpx.Response, stop_markers: tuple[bytes, ...]) -> bytes:
+    """Read a streamed probe reply only until it can be classified, then let the caller close it."""
+    buf = bytearray()
+    for chunk in resp.iter_bytes(4096):
+        buf += chunk.lower()
+        if len(buf) >= _PROBE_BYTES or any(marker in buf for marker in stop_markers):
+            break
+    return bytes(buf[:_PROBE_BYTES])
 
 
 def test_indexer_connection(indexer: Indexer) -> tuple[bool, str]:
-    url = _build_api_url(indexer.api_url)
+    url = indexer.api_endpoint
     params: dict[str, str] = {"t": "caps"}
     if indexer.api_key:
         params["apikey"] = indexer.api_key
     logger.debug("Testing indexer caps", name=indexer.name, url=url)
     try:
-        resp = httpx.get(url, params=params, timeout=10)
+        with _CLIENT.stream("GET", url, params=params) as resp:
+            if resp.status_code != 200:
+                logger.warning("Indexer caps non-200", name=indexer.name, status=resp.status_code)
+                return False, f"HTTP {resp.status_code} from indexer"
+
+            content_type = (resp.headers.get("content-type") or "").lower()
+            if "text/html" in content_type:
+                return False, "HTML response; check API URL (no caps)"
+
+            is_json = "application/json" in content_type
+            if is_json:
+                resp.read()
+                head = resp.content[:_PROBE_BYTES].lower()
+            else:
+                # Markers sit at the top of the document, so stop downloading once one shows up.
+                head = _read_probe_head(resp, _CAPS_MARKERS)
     except httpx.RequestError as exc:
         logger.warning("Indexer caps request failed", name=indexer.name, url=url, error=str(exc))
         return False, f"Request failed: {exc}"
 
-    if resp.status_code != 200:
-        logger.warning("Indexer caps non-200", name=indexer.name, status=resp.status_code)
-        return False, f"HTTP {resp.status_code} from indexer"
-
-    content_type = (resp.headers.get("content-type") or "").lower()
-    text = resp.text.lower() if resp.text else ""
-
-    if "text/html" in content_type:
-        return False, "HTML response; check API URL (no caps)"
-
-    if "<error" in text or "invalid api" in text or "apikey" in text and "invalid" in text:
+    if b"<error" in head or b"invalid api" in head or (b"apikey" in head and b"invalid" in head):
         return False, "Indexer reported API key error"
 
-    has_caps = "<caps" in text or "<newznab" in text
+    has_caps = b"<caps" in head or b"<newznab" in head
 
-    if "application/json" in content_type:
-        data = resp.json()
-        if isinstance(data, dict) and data.get("error"):
-            return False, f"Indexer error: {data.get('error')}"
+    if is_json:
+        # Only decode the body when it can change the outcome: no caps seen, or an error key present.
+        if not has_caps or b'"error"' in head:
+            try:
+                data = resp.json()
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get("error"):
+                return False, f"Indexer error: {data.get('error')}"
         if not has_caps:
             logger.warning("Indexer JSON without caps", name=indexer.name)
             return False, "JSON response without caps"
@@ -53,22 +132,24 @@ def test_indexer_connection(indexer: Indexer) -> tuple[bool, str]:
         logger.warning("Indexer response missing caps", name=indexer.name)
         return False, "Unexpected response from indexer (no caps)"
 
-    # If API key is provided, perform a lightweight authenticated search to validate the key.
+    # Caps usually doesn't require a key, so only an authenticated search proves it.
     if indexer.api_key:
         logger.debug("Testing indexer search with API key", name=indexer.name)
         search_params = {"t": "search", "q": "f1", "limit": 1, "apikey": indexer.api_key}
         try:
-            search_resp = httpx.get(url, params=search_params, timeout=10)
+            with _CLIENT.stream("GET", url, params=search_params) as search_resp:
+                if search_resp.status_code != 200:
+                    logger.warning("Indexer search non-200", name=indexer.name, status=search_resp.status_code)
+                    return False, f"HTTP {search_resp.status_code} from indexer search"
+                search_content_type = (search_resp.headers.get("content-type") or "").lower()
+                # One row is enough to validate the key; stop after the first item.
+                search_head = _read_probe_head(search_resp, _SEARCH_MARKERS)
         except httpx.RequestError as exc:
             logger.warning("Indexer search request failed", name=indexer.name, error=str(exc))
             return False, f"Search request failed: {exc}"
-        if search_resp.status_code != 200:
-            logger.warning("Indexer search non-200", name=indexer.name, status=search_resp.status_code)
-            return False, f"HTTP {search_resp.status_code} from indexer search"
-        search_text = search_resp.text.lower() if search_resp.text else ""
-        if "<error" in search_text or ("apikey" in search_text and "invalid" in search_text):
+        if b"<error" in search_head or (b"apikey" in search_head and b"invalid" in search_head):
             return False, "Indexer search reports API key invalid"
-        if "text/html" in (search_resp.headers.get("content-type") or "").lower():
+        if "text/html" in search_content_type:
             logger.warning("Indexer search returned HTML", name=indexer.name)
             return False, "HTML response on search; API key may be invalid"
 
@@ -76,41 +157,51 @@ def test_indexer_connection(indexer: Indexer) -> tuple[bool, str]:
     return True, "Caps retrieved"
 
 
-def _parse_item(item: ET.Element, indexer_name: str) -> SearchResult | None:
-    title = (item.findtext("title") or "").strip()
+def _parse_item(item: ET.Element, indexer_name: str, now: datetime) -> SearchResult | None:
+    # Single pass over the children instead of one findtext()/findall() walk per field.
+    texts: dict[str, str | None] = {}
+    enclosure_url: str | None = None
+    attr_size: str | None = None
+    for child in item:
+        tag = child.tag
+        if tag == "enclosure":
+            enclosure_url = enclosure_url or child.get("url")
+        elif tag == "attr" or tag.endswith("}attr"):
+            if attr_size is None and child.get("name") == "size" and child.get("value"):
+                attr_size = child.get("value")
+        else:
+            texts.setdefault(tag, child.text)
+
+    title = (texts.get("title") or "").strip()
     if not title:
         return None
 
     # NZB/Download URL
-    nzb_url = (item.findtext("link") or "").strip() or None
-    enclosure = item.find("enclosure")
-    if not nzb_url and enclosure is not None:
-        nzb_url = enclosure.attrib.get("url")
+    nzb_url = (texts.get("link") or "").strip() or None
+    if not nzb_url and enclosure_url:
+        nzb_url = enclosure_url
 
     # Size (prefer <size>, then attr name="size")
     size_mb = 0.0
-    size_text = item.findtext("size")
-    if size_text and size_text.isdigit():
-        size_mb = float(int(size_text) / 1024 / 1024)
-    else:
-        for attr in item.findall("{*}attr"):
-            if attr.attrib.get("name") == "size" and attr.attrib.get("value"):
-                try:
-                    size_bytes = float(attr.attrib.get("value"))
-                    size_mb = size_bytes / 1024 / 1024
-                except ValueError:
-                    pass
-                break
+    size_text = texts.get("size")
+    try:
+        size_mb = int(size_text) * _MB
+    except (TypeError, ValueError):
+        if attr_size:
+            try:
+                size_mb = float(attr_size) * _MB
+            except ValueError:
+                pass
 
     # Age from pubDate if present
     age_days = 0
-    pub_date_text = item.findtext("pubDate")
+    pub_date_text = texts.get("pubDate")
     if pub_date_text:
         try:
             dt = parsedate_to_datetime(pub_date_text)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
-            age_days = max(0, int((datetime.now(timezone.utc) - dt).total_seconds() / 86400))
+            age_days = max(0, int((now - dt).total_seconds() / 86400))
         except Exception:
             pass
 
@@ -136,43 +227,71 @@ def _parse_item(item: ET.Element, indexer_name: str) -> SearchResult | None:
     )
 
 
-def search_indexer(indexer: Indexer, query: str, limit: int = 25) -> list[SearchResult]:
-    url = _build_api_url(indexer.api_url)
-    params: dict[str, str] = {"t": "search", "q": query, "limit": str(limit)}
-    if indexer.api_key:
-        params["apikey"] = indexer.api_key
-    if indexer.category:
-        params["cat"] = indexer.category
+def _read_items(resp: httpx.Response, indexer_name: str, limit: int, head: bytearray) -> list[SearchResult]:
+    """Parse <item> elements as they stream in, stopping once `limit` results are collected."""
+    parser = ET.XMLPullParser(events=("end",))
+    items: list[SearchResult] = []
+    now = datetime.now(timezone.utc)
+
+    def _drain() -> bool:
+        for _, elem in parser.read_events():
+            if elem.tag != "item":
+                continue
+            parsed = _parse_item(elem, indexer_name, now)
+            # Drop the item's subtree once consumed so memory stays bounded by a single item.
+            elem.clear()
+            if parsed:
+                items.append(parsed)
+                if len(items) >= limit:
+                    return True
+        return False
+
+    for chunk in resp.iter_bytes(_CHUNK_SIZE):
+        if len(head) < _SNIPPET_BYTES:
+            head += chunk[: _SNIPPET_BYTES - len(head)]
+        parser.feed(chunk)
+        if _drain():
+            return items
+    parser.close()
+    _drain()
+    return items
+
+
+def search_indexer(indexer: Indexer, query: str, limit: int = 25, *, use_cache: bool = True) -> list[SearchResult]:
+    """Search one indexer; use_cache=False skips the cached reply (forced refresh) but still stores the new one."""
+    url = indexer.api_endpoint
+    params: dict[str, str] = {"t": "search", "q": query, "limit": str(limit), **indexer.base_params}
 
     safe_params = dict(params)
     if "apikey" in safe_params:
         safe_params["apikey"] = "***"
+    cache_key = _search_cache_key(url, params)
+    cached = _search_cache_get(cache_key) if use_cache else None
+    if cached is not None:
+        logger.debug("Indexer search cache hit", name=indexer.name, query=query, count=len(cached))
+        return cached
+
     start = perf_counter()
     logger.debug("Searching indexer", name=indexer.name, query=query, url=url, params=safe_params)
+    head = bytearray()
     try:
-        resp = httpx.get(url, params=params, timeout=15)
+        with _CLIENT.stream("GET", url, params=params, timeout=15) as resp:
+            if resp.status_code != 200:
+                logger.warning("Indexer search non-200", name=indexer.name, status=resp.status_code)
+                return []
+            # Leaving the block early (limit reached) closes the response and skips the feed's tail.
+            items = _read_items(resp, indexer.name, limit, head)
+            status_code = resp.status_code
+            content_type = resp.headers.get("content-type")
+            body_len = resp.num_bytes_downloaded
     except httpx.RequestError as exc:
         logger.warning("Indexer search request failed", name=indexer.name, error=str(exc))
         return []
-
-    if resp.status_code != 200:
-        logger.warning("Indexer search non-200", name=indexer.name, status=resp.status_code)
-        return []
-
-    try:
-        root = ET.fromstring(resp.text)
     except ET.ParseError:
-        snippet = (resp.text or "")[:500]
+        snippet = head.decode("utf-8", "replace")
         logger.warning("Indexer search XML parse failed", name=indexer.name, snippet=snippet)
         return []
-
-    items: list[SearchResult] = []
-    for item in root.findall(".//item"):
-        parsed = _parse_item(item, indexer.name)
-        if parsed:
-            items.append(parsed)
-            if len(items) >= limit:
-                break
+    _search_cache_put(cache_key, items)
 
     elapsed_ms = int((perf_counter() - start) * 1000)
     logger.debug(
@@ -180,17 +299,29 @@ def search_indexer(indexer: Indexer, query: str, limit: int = 25) -> list[Search
         name=indexer.name,
         query=query,
         count=len(items),
-        status=resp.status_code,
-        content_type=resp.headers.get("content-type"),
-        body_len=len(resp.text or ""),
+        status=status_code,
+        content_type=content_type,
+        body_len=body_len,
         elapsed_ms=elapsed_ms,
     )
 
     if len(items) == 0:
-        logger.debug(
+        # Lazy so the snippet is only decoded when DEBUG is actually enabled.
+        logger.bind(name=indexer.name, query=query).opt(lazy=True).debug(
             "Indexer search empty body snippet",
-            name=indexer.name,
-            query=query,
-            snippet=(resp.text or "")[:500],
+            snippet=lambda: head.decode("utf-8", "replace"),
         )
     return items
+
+
+def map_indexers(fn: Callable[[Indexer], T], indexers: Sequence[Indexer]) -> list[T]:
+    """Run `fn` for every indexer concurrently and return the results in indexer order.
+
+    Indexer queries are network-bound, so overlapping them makes a multi-indexer search
+    take roughly as long as the slowest indexer instead of the sum of all of them.
+    """
+    if len(indexers) <= 1:
+        return [fn(ix) for ix in indexers]
+    workers = min(_MAX_PARALLEL_INDEXERS, len(indexers))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="indexer-search") as pool:
+        return list(pool.map(fn, indexers))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Iterable
-from sqlalchemy import text
+from sqlalchemy import RowMapping, text
 from sqlalchemy.orm import Session
 from loguru import logger
 
@@ -10,8 +10,14 @@ STATUS_PENDING = "pending"
 STATUS_COMPLETED = "completed"
 STATUS_FAILED = "failed"
 
+# Engines (by id) whose manual_download table has already been created in this process.
+_table_ready: set[int] = set()
+
 
 def _ensure_table(session: Session) -> None:
+    engine_id = id(session.get_bind())
+    if engine_id in _table_ready:
+        return
     session.execute(
         text(
             """
@@ -26,6 +32,17 @@ def _ensure_table(session: Session) -> None:
             """
         )
     )
+    # Pending lookups seek on status instead of scanning completed/failed history.
+    session.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_manual_download_status_created ON manual_download (status, created_at)")
+    )
+    session.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS ix_manual_download_pending ON manual_download (tag) "
+            f"WHERE status = '{STATUS_PENDING}'"
+        )
+    )
+    _table_ready.add(engine_id)
 
 
 def record_manual_download(session: Session, *, tag: str, title: str, downloader_id: int) -> None:
@@ -33,8 +50,14 @@ def record_manual_download(session: Session, *, tag: str, title: str, downloader
     session.execute(
         text(
             """
-            INSERT OR REPLACE INTO manual_download (tag, title, downloader_id, status, created_at, last_error)
+            INSERT INTO manual_download (tag, title, downloader_id, status, created_at, last_error)
             VALUES (:tag, :title, :downloader_id, :status, :created_at, NULL)
+            ON CONFLICT(tag) DO UPDATE SET
+                title = excluded.title,
+                downloader_id = excluded.downloader_id,
+                status = excluded.status,
+                created_at = excluded.created_at,
+                last_error = NULL
             """
         ),
         {
@@ -55,23 +78,36 @@ def record_manual_download(session: Session, *, tag: str, title: str, downloader
     )
 
 
-def list_manual_pending(session: Session) -> list[dict]:
+def list_manual_pending(session: Session) -> list[RowMapping]:
     _ensure_table(session)
-    rows = session.execute(
+    # The status is inlined (not bound) so SQLite can match the partial pending index.
+    data = session.execute(
         text(
-            """
+            f"""
             SELECT tag, title, downloader_id, status, last_error
             FROM manual_download
-            WHERE status = :status
+            WHERE status = '{STATUS_PENDING}'
             """
         ),
-        {"status": STATUS_PENDING},
-    ).mappings()
-    data = [dict(row) for row in rows]
+    ).mappings().all()
     logger.debug("manual_download_pending", count=len(data))
     return data
 
 
+def get_manual_pending(session: Session, tag: str) -> RowMapping | None:
+    _ensure_table(session)
+    return session.execute(
+        text(
+            f"""
+            SELECT tag, title, downloader_id, status, last_error
+            FROM manual_download
+            WHERE status = '{STATUS_PENDING}' AND tag = :tag
+            """
+        ),
+        {"tag": tag},
+    ).mappings().first()
+
+
 def update_manual_status(
     session: Session,
     *,
@@ -1,13 +1,69 @@
 from __future__ import annotations
 
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+import atexit
 import hashlib
+import json
 import time
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
 import httpx
-from apprise import Apprise
 from loguru import logger
 
+# Reused across webhook deliveries so repeat posts to the same host keep their connection.
+_CLIENT = httpx.Client(http2=True, timeout=10, limits=httpx.Limits(keepalive_expiry=30.0))
+atexit.register(_CLIENT.close)
+_MAX_WEBHOOK_WORKERS = 8
+
+
+@lru_cache(maxsize=1)
+def _get_apprise_cls() -> type:
+    # apprise discovers its notifier plugins on import; only pay that when an apprise target is used.
+    from apprise import Apprise
+
+    return Apprise
+
+
+def _post_webhook(
+    idx: int, target: dict[str, Any], body: bytes
+) -> tuple[int, int | None, float, Exception | None]:
+    """Deliver one webhook; returns (target index, status, elapsed ms, error)."""
+    headers = {"content-type": "application/json"}
+    secret = target.get("secret")
+    if secret:
+        headers["X-Webhook-Secret"] = str(secret)
+    start = time.monotonic()
+    try:
+        resp = _CLIENT.post(target["url"], content=body, headers=headers)
+    except Exception as exc:
+        return idx, None, round((time.monotonic() - start) * 1000, 2), exc
+    return idx, resp.status_code, round((time.monotonic() - start) * 1000, 2), None
+
+
+# Never log or emit full notification URLs or secrets; only use minimal identifiers.
+@lru_cache(maxsize=1024)
+def _target_fingerprint(value: str) -> tuple[str, str]:
+    """Return a stable short id and sanitized host/scheme for a target string."""
+    if not value:
+        return "unknown", "unknown"
+    parsed = urlparse(value)
+    host = parsed.hostname or "unknown"
+    scheme = parsed.scheme or "unknown"
+    # Drop path/query/fragment/userinfo to avoid leaking secrets.
+    sanitized = urlunparse((scheme, host, "", "", "", ""))
+    finger = hashlib.sha256((scheme + "::" + host).encode()).hexdigest()[:8]
+    return finger, sanitized
+
+
+def event_data(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Webhook `data` for one or more events of the same type.
+
+    `events` carries every entry; the flat title/downloader/reason keys mirror the first entry so
+    consumers of the older flat payload keep working (deprecated, to be dropped next release).
+    """
+    return {**entries[0], "events": entries}
+
 
 def send_notifications(
     targets: list[dict[str, Any]],
@@ -18,42 +74,37 @@ def send_notifications(
     data: dict[str, Any] | None = None,
 ) -> tuple[bool, list[str]]:
     errors: list[str] = []
-    # Never log or emit full notification URLs or secrets; only use minimal identifiers.
-    def _target_fingerprint(value: str | None) -> tuple[str, str]:
-        """Return a stable short id and sanitized host/scheme for a target string."""
-        if not value:
-            return "unknown", "unknown"
-        parsed = urlparse(str(value))
-        host = parsed.hostname or "unknown"
-        scheme = parsed.scheme or "unknown"
-        # Drop path/query/fragment/userinfo to avoid leaking secrets.
-        sanitized = urlunparse((scheme, host, "", "", "", ""))
-        finger = hashlib.sha256((scheme + "::" + host).encode()).hexdigest()[:8]
-        return finger, sanitized
-
     logger.debug(
         "notifications_start",
         target_count=len(targets or []),
         event=event,
     )
 
-    allowed = []
+    # Filter by subscribed events and split by delivery type in a single pass.
+    apprise_targets: list[dict[str, Any]] = []
+    webhook_targets: list[dict[str, Any]] = []
     for target in targets:
         if not isinstance(target, dict):
             continue
         events = target.get("events") or []
         if event and event != "test" and events and event not in events:
             continue
-        allowed.append(target)
+        kind = target.get("type")
+        if kind == "apprise":
+            apprise_targets.append(target)
+        elif kind == "webhook":
+            webhook_targets.append(target)
 
-    if not allowed:
+    if not apprise_targets and not webhook_targets:
         return True, []
 
-    apprise_targets = [t for t in allowed if t.get("type") == "apprise"]
     apprise_ok = 0
     apprise_err = 0
     if apprise_targets:
         logger.debug("notifications_apprise_send", count=len(apprise_targets), event=event)
+        # One Apprise instance for every target lets it dispatch to all of them concurrently.
+        ap_obj = _get_apprise_cls()()
+        added: list[tuple[str, str]] = []
         for target in apprise_targets:
             url = target.get("url")
             if not url:
@@ -63,105 +114,117 @@ def send_notifications(
                 continue
             finger, sanitized = _target_fingerprint(url)
             try:
-                ap_obj = Apprise()
-                added = ap_obj.add(url)
-                if not added:
-                    apprise_err += 1
-                    errors.append(f"Apprise target rejected for host {sanitized} (id {finger})")
-                    logger.error(
-                        "notifications_apprise_target_rejected",
-                        target_id=finger,
-                        host=sanitized,
-                        reason="apprise_add_returned_false",
-                    )
-                    continue
-                logger.debug(
-                    "notifications_apprise_target_added",
+                ok = ap_obj.add(url)
+            except Exception as exc:  # pragma: no cover - library failure path
+                apprise_err += 1
+                logger.error(
+                    "Apprise notification failed",
+                    error_type=type(exc).__name__,
+                    error_message=str(exc)[:200],
                     target_id=finger,
                     host=sanitized,
                 )
-                start = time.monotonic()
+                errors.append("Apprise error")
+                continue
+            if not ok:
+                apprise_err += 1
+                errors.append(f"Apprise target rejected for host {sanitized} (id {finger})")
+                logger.error(
+                    "notifications_apprise_target_rejected",
+                    target_id=finger,
+                    host=sanitized,
+                    reason="apprise_add_returned_false",
+                )
+                continue
+            added.append((finger, sanitized))
+            logger.debug(
+                "notifications_apprise_target_added",
+                target_id=finger,
+                host=sanitized,
+            )
+
+        if added:
+            target_ids = [finger for finger, _ in added]
+            start = time.monotonic()
+            try:
                 ok = ap_obj.notify(body=message, title=title)
+            except Exception as exc:  # pragma: no cover - library failure path
+                apprise_err += len(added)
+                logger.error(
+                    "Apprise notification failed",
+                    error_type=type(exc).__name__,
+                    error_message=str(exc)[:200],
+                    target_ids=target_ids,
+                )
+                errors.append("Apprise error")
+            else:
                 elapsed_ms = round((time.monotonic() - start) * 1000, 2)
+                # Apprise only reports an aggregate result across the batch.
                 if ok:
-                    apprise_ok += 1
+                    apprise_ok += len(added)
                     logger.debug(
-                        "notifications_apprise_target_ok",
-                        target_id=finger,
-                        host=sanitized,
+                        "notifications_apprise_ok",
+                        target_ids=target_ids,
                         elapsed_ms=elapsed_ms,
                     )
                 else:
-                    apprise_err += 1
+                    apprise_err += len(added)
                     errors.append("Apprise notify returned false")
                     logger.warning(
-                        "notifications_apprise_target_false",
-                        target_id=finger,
-                        host=sanitized,
+                        "notifications_apprise_false",
+                        target_ids=target_ids,
                         elapsed_ms=elapsed_ms,
                     )
-            except Exception as exc:  # pragma: no cover - library failure path
-                apprise_err += 1
-                logger.error(
-                    "Apprise notification failed",
-                    error_type=type(exc).__name__,
-                    error_message=str(exc)[:200],
-                    target_id=finger,
-                    host=sanitized,
-                )
-                errors.append("Apprise error")
 
-    webhook_targets = [t for t in allowed if t.get("type") == "webhook"]
     webhook_ok = 0
     webhook_err = 0
-    if webhook_targets:
+    webhook_jobs = [(idx, target) for idx, target in enumerate(webhook_targets) if target.get("url")]
+    if webhook_jobs:
         logger.debug("notifications_webhook_send", count=len(webhook_targets), event=event)
-    for idx, target in enumerate(webhook_targets):
-        url = target.get("url")
-        if not url:
-            continue
-        finger, sanitized = _target_fingerprint(url)
-        headers = {}
-        secret = target.get("secret")
-        if secret:
-            headers["X-Webhook-Secret"] = str(secret)
-        payload = {"event": event or "notify", "message": message, "data": data or {}}
-        try:
-            start = time.monotonic()
-            resp = httpx.post(url, json=payload, headers=headers, timeout=10)
-            elapsed_ms = round((time.monotonic() - start) * 1000, 2)
-            if resp.status_code >= 300:
-                errors.append(f"Webhook target {idx + 1} returned {resp.status_code}")
-                webhook_err += 1
-                logger.debug(
-                    "notifications_webhook_non200",
-                    target_index=idx,
-                    status=resp.status_code,
-                    target_id=finger,
-                    host=sanitized,
-                    elapsed_ms=elapsed_ms,
-                )
-            else:
-                webhook_ok += 1
-                logger.debug(
-                    "notifications_webhook_ok",
-                    target_index=idx,
-                    status=resp.status_code,
-                    target_id=finger,
-                    host=sanitized,
-                    elapsed_ms=elapsed_ms,
-                )
-        except Exception as exc:
-            webhook_err += 1
-            logger.error(
-                "Webhook notification failed",
-                target_index=idx,
-                error_type=type(exc).__name__,
-                error_message=str(exc)[:200],
-                target_id=finger,
-                host=sanitized,
-            )
-            errors.append(f"Webhook target {idx + 1} error")
+        # Every target gets the same payload, so serialize it once up front.
+        body = json.dumps(
+            {"event": event or "notify", "message": message, "data": data or {}},
+            separators=(",", ":"),
+        ).encode()
+        workers = min(_MAX_WEBHOOK_WORKERS, len(webhook_jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="webhook") as pool:
+            futures = [pool.submit(_post_webhook, idx, target, body) for idx, target in webhook_jobs]
+            # Deliveries overlap; results are read back in target order so errors stay stable.
+            for future in futures:
+                idx, status_code, elapsed_ms, exc = future.result()
+                finger, sanitized = _target_fingerprint(webhook_targets[idx]["url"])
+                if exc is not None:
+                    webhook_err += 1
+                    logger.error(
+                        "Webhook notification failed",
+                        target_index=idx,
+                        error_type=type(exc).__name__,
+                        error_message=str(exc)[:200],
+                        target_id=finger,
+                        host=sanitized,
+                    )
+                    errors.append(f"Webhook target {idx + 1} error")
+                elif status_code >= 300:
+                    errors.append(f"Webhook target {idx + 1} returned {status_code}")
+                    webhook_err += 1
+                    logger.debug(
+                        "notifications_webhook_non200",
+                        target_index=idx,
+                        status=status_code,
+                        target_id=finger,
+                        host=sanitized,
+                        elapsed_ms=elapsed_ms,
+                    )
+                else:
+                    webhook_ok += 1
+                    logger.debug(
+                        "notifications_webhook_ok",
+                        target_index=idx,
+                        status=status_code,
+                        target_id=finger,
+                        host=sanitized,
+                        elapsed_ms=elapsed_ms,
+                    )
 
     apprise_count = len(apprise_targets)
     webhook_count = len(webhook_targets)
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+import re
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import Counter
+from operator import attrgetter
+from datetime import datetime, timedelta, timezone
 from typing import Iterable, Optional
+from fastapi import HTTPException, status as http_status
 from loguru import logger
+from sqlalchemy import Select, bindparam, func, or_, select, text, update
 from sqlalchemy.orm import Session, selectinload
 
 from ..core.database import SessionLocal
 from ..models.entities import ScheduledSearch, Round, Downloader, Indexer, Season
-from ..schemas.common import ScheduledSearchCreate, SearchSettings
+from ..schemas.common import ScheduledSearchCreate, SearchResult, SearchSettings
 from ..services.app_config import get_search_settings, DEFAULT_AUTO_DOWNLOAD_THRESHOLD, list_notification_targets
 from ..services.downloader_client import send_to_downloader, list_history
-from ..services.notifications import send_notifications
+from ..services.indexer_client import register_search_cache_clearer
+from ..services.notifications import event_data, send_notifications
 from ..services.manual_downloads import (
     list_manual_pending,
     update_manual_status,
+    get_manual_pending,
     STATUS_COMPLETED as MANUAL_COMPLETED,
     STATUS_FAILED as MANUAL_FAILED,
 )
@@ -29,6 +37,156 @@ STATUS_COMPLETED = "completed"
 STATUS_FAILED = "failed"
 STATUS_PAUSED = "paused"
 
+# Due searches processed at once per tick; each is dominated by indexer/downloader I/O.
+_MAX_CONCURRENT_RUNS = 8
+# Retry cadence windows used by _compute_next_run.
+_T10M = timedelta(minutes=10)
+_T30M = timedelta(minutes=30)
+_T6H = timedelta(hours=6)
+_T24H = timedelta(hours=24)
+_T48H = timedelta(hours=48)
+_T168H = timedelta(hours=168)
+# Short-lived cache of round-level search results, so retries and run_now racing a tick reuse one fan-out.
+_ROUND_SEARCH_TTL_SECONDS = 30.0
+_ROUND_SEARCH_MAX_ENTRIES = 256
+_ROUND_SEARCH_CACHE: dict[tuple, tuple[float, list[SearchResult]]] = {}
+_ROUND_SEARCH_LOCK = threading.Lock()
+# Racecarr tags are appended to job names in brackets, e.g. "... [rc-12-sprint qualifying]".
+_TAG_PREFIX = "rc-"
+_RC_TAG_RE = re.compile(r"\[(rc-[^\]]+)\]", re.IGNORECASE)
+# Downloader history/callback states that settle a tracked download.
+_DONE_STATES = frozenset({"completed", "success", "ok"})
+_FAILED_STATES = frozenset({"failed", "failure", "error"})
+_SCORE = attrgetter("score")
+# Due searches claimed per tick; leftovers are picked up on the next (short) wake.
+_CLAIM_BATCH = 100
+# A claim older than this is treated as abandoned (worker crashed or was killed) and released.
+_CLAIM_LEASE = timedelta(minutes=30)
+# Floor for the tick sleep so an item stuck in the past can't spin the loop.
+_MIN_SLEEP_SECONDS = 5
+
+
+def _active_searches(*columns) -> Select:
+    """Scheduled searches whose season isn't hidden; callers add their own filters and ordering."""
+    return (
+        select(*(columns or (ScheduledSearch,)))
+        .join(Round, Round.id == ScheduledSearch.round_id)
+        .join(Season, Season.id == Round.season_id)
+        .where(Season.is_deleted.is_(False))
+    )
+
+
+# Per-tick statements are built once at import; SQLAlchemy's compiled cache then reuses their SQL.
+_DUE_IDS_STMT = (
+    _active_searches(ScheduledSearch.id)
+    .where(
+        # Inlined (not bound) so SQLite can match the partial ix_sched_due index.
+        text(f"scheduled_search.status IN ('{STATUS_PENDING}', '{STATUS_FAILED}')"),
+        or_(ScheduledSearch.next_run_at.is_(None), ScheduledSearch.next_run_at <= bindparam("now")),
+    )
+    .order_by(ScheduledSearch.next_run_at.asc().nullsfirst())
+    .limit(_CLAIM_BATCH)
+    .with_for_update(of=ScheduledSearch, skip_locked=True)
+)
+# Same filter as the claim, so rows run_due can never pick up (hidden season, deleted round) don't set the wake.
+_NEXT_DUE_STMT = _active_searches(func.min(ScheduledSearch.next_run_at)).where(
+    text(f"scheduled_search.status IN ('{STATUS_PENDING}', '{STATUS_FAILED}')")
+)
+_WAITING_STMT = _active_searches(
+    ScheduledSearch.id,
+    ScheduledSearch.round_id,
+    ScheduledSearch.event_type,
+    ScheduledSearch.tag,
+    ScheduledSearch.downloader_id,
+    ScheduledSearch.event_start_utc,
+    ScheduledSearch.nzb_title,
+).where(ScheduledSearch.status == STATUS_WAITING)
+_LIST_STMT = _active_searches().order_by(
+    ScheduledSearch.next_run_at.asc().nullsfirst(), ScheduledSearch.added_at.asc()
+)
+
+
+def _utcnow() -> datetime:
+    # Stored datetimes are naive UTC, so drop tzinfo to keep comparisons against them valid.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _events_by_type(round_obj: Round) -> dict[str, Optional[datetime]]:
+    """Lowercased event type -> start time for a round, built once and kept on the instance."""
+    cached = round_obj.__dict__.get("_events_by_type")
+    if cached is None:
+        cached = {}
+        for ev in round_obj.events or []:
+            cached.setdefault((ev.type or "").lower(), ev.start_time_utc)
+        round_obj.__dict__["_events_by_type"] = cached
+    return cached
+
+
+def _search_round_cached(
+    season: Season,
+    round_obj: Round,
+    indexers: list[Indexer],
+    event_types: set[str],
+    limit_per_query: int,
+    use_cache: bool = True,
+) -> list[SearchResult]:
+    """_search_round_events behind a brief TTL cache keyed by round, event types and indexers.
+
+    use_cache=False (run now) bypasses this and the per-query indexer cache, then stores the fresh results.
+    """
+    key = (season.year, round_obj.id, frozenset(event_types), tuple(ix.id for ix in indexers), limit_per_query)
+    now = time.monotonic()
+    if use_cache:
+        with _ROUND_SEARCH_LOCK:
+            entry = _ROUND_SEARCH_CACHE.get(key)
+        if entry and now - entry[0] <= _ROUND_SEARCH_TTL_SECONDS:
+            # Scoring annotates results in place, so every caller gets its own copies.
+            return [item.model_copy() for item in entry[1]]
+    results = _search_round_events(
+        season, round_obj, indexers, event_types, limit_per_query=limit_per_query, use_cache=use_cache
+    )
+    with _ROUND_SEARCH_LOCK:
+        if len(_ROUND_SEARCH_CACHE) >= _ROUND_SEARCH_MAX_ENTRIES:
+            for stale in [k for k, (ts, _) in _ROUND_SEARCH_CACHE.items() if now - ts > _ROUND_SEARCH_TTL_SECONDS]:
+                del _ROUND_SEARCH_CACHE[stale]
+            if len(_ROUND_SEARCH_CACHE) >= _ROUND_SEARCH_MAX_ENTRIES:
+                del _ROUND_SEARCH_CACHE[next(iter(_ROUND_SEARCH_CACHE))]
+        _ROUND_SEARCH_CACHE[key] = (now, [item.model_copy() for item in results])
+    return results
+
+
+def _clear_round_search_cache() -> None:
+    with _ROUND_SEARCH_LOCK:
+        _ROUND_SEARCH_CACHE.clear()
+
+
+# Editing or removing an indexer clears its search cache; round results built from it must go too.
+register_search_cache_clearer(_clear_round_search_cache)
+
+
+def batch_fetch_rounds(session: Session, ids: Iterable[int]) -> dict[int, Round]:
+    """Load rounds (with events and season) for all ids in one query, keyed by id."""
+    wanted = set(ids)
+    if not wanted:
+        return {}
+    rounds = (
+        session.query(Round)
+        .options(selectinload(Round.events), selectinload(Round.season))
+        .filter(Round.id.in_(wanted))
+        .all()
+    )
+    return {round_obj.id: round_obj for round_obj in rounds}
+
+
+def index_history_tags(history: list[dict[str, str]]) -> dict[str, dict[str, str]]:
+    """Map each rc-* tag found in history job names to its newest row, in one scan."""
+    by_tag: dict[str, dict[str, str]] = {}
+    for row in history:
+        # Match case-insensitively and lowercase only the bracketed tag, not every job name.
+        for token in _RC_TAG_RE.findall(row.get("name") or ""):
+            by_tag.setdefault(token.lower(), row)
+    return by_tag
+
 
 class SchedulerService:
     def __init__(self, tick_seconds: int = 600, poll_seconds: int = 600) -> None:
@@ -37,35 +195,52 @@ class SchedulerService:
         self._task: asyncio.Task | None = None
         self._poll_task: asyncio.Task | None = None
         self._running = False
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
         self._task = asyncio.create_task(self._run_loop(), name="scheduler-tick")
         self._poll_task = asyncio.create_task(self._poll_loop(), name="scheduler-poll")
         logger.info("Scheduler service started")
 
     async def stop(self) -> None:
         self._running = False
-        for task in (self._task, self._poll_task):
-            if task:
-                task.cancel()
-        for task in (self._task, self._poll_task):
-            if task:
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        tasks = [task for task in (self._task, self._poll_task) if task]
+        for task in tasks:
+            task.cancel()
+        # Let both loops settle their cancellation together rather than one after the other.
+        await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("Scheduler service stopped")
 
+    def wake(self) -> None:
+        """Re-evaluate due searches now; safe to call from request worker threads."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _delay_until(self, next_at: Optional[datetime]) -> float:
+        if next_at is None:
+            return self._tick_seconds
+        seconds = (next_at - _utcnow()).total_seconds()
+        return min(self._tick_seconds, max(_MIN_SLEEP_SECONDS, seconds))
+
     async def _run_loop(self) -> None:
         while self._running:
             try:
-                await self.run_due()
+                delay = self._delay_until(await self.run_due())
             except Exception as exc:  # pragma: no cover - defensive
                 logger.exception("Scheduler tick failed", error=str(exc))
-            await asyncio.sleep(self._tick_seconds)
+                delay = self._tick_seconds
+            # Sleep until the earliest search is due, or until a create/update wakes us.
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
 
     async def _poll_loop(self) -> None:
         while self._running:
@@ -75,15 +250,28 @@ class SchedulerService:
                 logger.exception("Scheduler poll failed", error=str(exc))
             await asyncio.sleep(self._poll_seconds)
 
-    def _notify_event(
+    def _queue_event(
         self,
-        session: Session,
+        events: list[dict[str, str | None]],
         *,
         event: str,
         title: str,
         downloader: Downloader | None = None,
         reason: str | None = None,
     ) -> None:
+        events.append(
+            {"event": event, "title": title, "downloader": downloader.name if downloader else None, "reason": reason}
+        )
+
+    async def _flush_events(self, session: Session, events: list[dict[str, str | None]]) -> None:
+        if events:
+            # Apprise/webhook delivery is blocking HTTP; keep it off the event loop.
+            await asyncio.to_thread(self._dispatch_events, session, events)
+
+    def _dispatch_events(self, session: Session, events: list[dict[str, str | None]]) -> None:
+        """Send everything queued during a tick: one target lookup, one delivery per event type."""
+        if not events:
+            return
         try:
             targets = list_notification_targets(session)
         except Exception as exc:
@@ -93,28 +281,36 @@ class SchedulerService:
         if not targets:
             return
 
-        downloader_name = downloader.name if downloader else None
-        label = event.replace("-", " ").capitalize()
-        message = f"{label}: {title}"
-        if downloader_name:
-            message = f"{message} ({downloader_name})"
-        if reason:
-            message = f"{message} - {reason}"
+        # Targets subscribe per event type, so batch within a type rather than across them.
+        grouped: dict[str, list[dict[str, str | None]]] = {}
+        for entry in events:
+            grouped.setdefault(entry["event"], []).append(entry)
 
-        try:
-            send_notifications(
-                targets,
-                message=message,
-                title="Racecarr",
-                event=event,
-                data={"title": title, "downloader": downloader_name, "reason": reason},
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Notification dispatch failed", event=event, error_type=type(exc).__name__)
+        for event, entries in grouped.items():
+            label = event.replace("-", " ").capitalize()
+            lines = []
+            for entry in entries:
+                line = f"{label}: {entry['title']}"
+                if entry["downloader"]:
+                    line = f"{line} ({entry['downloader']})"
+                if entry["reason"]:
+                    line = f"{line} - {entry['reason']}"
+                lines.append(line)
+            try:
+                send_notifications(
+                    targets,
+                    message="\n".join(lines),
+                    title="Racecarr",
+                    event=event,
+                    data=event_data([{k: v for k, v in entry.items() if k != "event"} for entry in entries]),
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Notification dispatch failed", event=event, error_type=type(exc).__name__)
 
-    async def run_due(self) -> None:
+    async def run_due(self) -> Optional[datetime]:
+        """Run every due search; returns the earliest next_run_at still scheduled, for the loop's sleep."""
         started = time.monotonic()
-        now = datetime.utcnow()
+        now = _utcnow()
         ran = 0
         status_counts = {
             STATUS_WAITING: 0,
@@ -123,24 +319,71 @@ class SchedulerService:
             STATUS_COMPLETED: 0,
             STATUS_PAUSED: 0,
         }
+        events: list[dict[str, str | None]] = []
         with SessionLocal() as session:
-            due_items = (
-                session.query(ScheduledSearch)
-                .join(Round, Round.id == ScheduledSearch.round_id)
-                .join(Season, Season.id == Round.season_id)
-                .filter(Season.is_deleted.is_(False))
-                .filter(ScheduledSearch.status.in_([STATUS_PENDING, STATUS_FAILED]))
-                .filter((ScheduledSearch.next_run_at.is_(None)) | (ScheduledSearch.next_run_at <= now))
-                .all()
-            )
+            self._expire_claims(session, now)
+            due_items = self._claim_due(session, now)
             due_count = len(due_items)
-            for item in due_items:
-                await self._run_single(session, item, now)
-                ran += 1
-                status = item.status or "unknown"
-                if status in status_counts:
-                    status_counts[status] += 1
-            session.commit()
+            try:
+                runnable: list[ScheduledSearch] = []
+                gated: list[dict] = []
+                for item in due_items:
+                    if self._before_start_window(item, now):
+                        gated.append(
+                            {
+                                "id": item.id,
+                                "status": STATUS_PENDING,
+                                "last_error": None,
+                                "next_run_at": self._compute_next_run(item.event_start_utc, now),
+                            }
+                        )
+                    else:
+                        runnable.append(item)
+                if gated:
+                    # Only the schedule moves for these; write them in one executemany instead of via the unit of work.
+                    session.execute(update(ScheduledSearch), gated)
+                    ran += len(gated)
+                    status_counts[STATUS_PENDING] += len(gated)
+                rounds_map = batch_fetch_rounds(session, (item.round_id for item in runnable))
+                cfg = get_search_settings(session)
+                indexers, downloaders = self._load_enabled_clients(session)
+                # ORM work stays on the loop thread; only the awaited network I/O inside overlaps.
+                sem = asyncio.Semaphore(_MAX_CONCURRENT_RUNS)
+
+                async def _guarded(item: ScheduledSearch) -> None:
+                    async with sem:
+                        await self._run_single(
+                            session, item, rounds_map.get(item.round_id), cfg, indexers, downloaders, now, events
+                        )
+
+                outcomes = await asyncio.gather(*(_guarded(item) for item in runnable), return_exceptions=True)
+                for item, outcome in zip(runnable, outcomes):
+                    if isinstance(outcome, Exception):
+                        # Don't leave the claim behind; retry on the normal cadence.
+                        item.status = STATUS_FAILED
+                        item.last_error = "Scheduler error"
+                        item.next_run_at = self._compute_next_run(item.event_start_utc, now)
+                        status_counts[STATUS_FAILED] += 1
+                        logger.error(
+                            "scheduler_run_single_failed",
+                            search_id=item.id,
+                            round_id=item.round_id,
+                            error_type=type(outcome).__name__,
+                            error=str(outcome),
+                        )
+                        continue
+                    ran += 1
+                    status = item.status or "unknown"
+                    if status in status_counts:
+                        status_counts[status] += 1
+                session.commit()
+                await self._flush_events(session, events)
+                next_wake = session.scalar(_NEXT_DUE_STMT)
+            except Exception:
+                # Hand the claims back now rather than leaving them to the lease.
+                session.rollback()
+                self._release_claims(session, [item.id for item in due_items])
+                raise
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.info(
             "scheduler_run_due",
@@ -153,43 +396,126 @@ class SchedulerService:
             paused=status_counts.get(STATUS_PAUSED, 0),
             duration_ms=duration_ms,
         )
+        return next_wake
+
+    def _claim_due(self, session: Session, now: datetime) -> list[ScheduledSearch]:
+        """Atomically flip a batch of due searches to running and return them for processing.
+
+        The row lock (SKIP LOCKED) lets several scheduler processes drain the queue on databases
+        that support it; the status-guarded UPDATE ... RETURNING is the claim everywhere else,
+        including SQLite.
+        """
+        due_ids = session.scalars(_DUE_IDS_STMT, {"now": now}).all()
+        if not due_ids:
+            session.commit()
+            return []
+        claimed = (
+            session.execute(
+                update(ScheduledSearch)
+                .where(
+                    ScheduledSearch.id.in_(due_ids),
+                    ScheduledSearch.status.in_([STATUS_PENDING, STATUS_FAILED]),
+                )
+                .values(status=STATUS_RUNNING, claimed_at=now)
+                .returning(ScheduledSearch.id)
+            )
+            .scalars()
+            .all()
+        )
+        # Commit the claim before any network work so other workers see it immediately.
+        session.commit()
+        if not claimed:
+            return []
+        return session.query(ScheduledSearch).filter(ScheduledSearch.id.in_(claimed)).all()
+
+    def _expire_claims(self, session: Session, now: datetime) -> None:
+        """Searches whose claim outlived the lease (crashed or killed worker) go back to pending."""
+        expired = session.execute(
+            update(ScheduledSearch)
+            .where(
+                ScheduledSearch.status == STATUS_RUNNING,
+                or_(ScheduledSearch.claimed_at.is_(None), ScheduledSearch.claimed_at < now - _CLAIM_LEASE),
+            )
+            .values(status=STATUS_PENDING, claimed_at=None)
+        ).rowcount
+        session.commit()
+        if expired:
+            logger.warning("scheduler_expired_stale_claims", count=expired)
+
+    def _release_claims(self, session: Session, ids: list[int]) -> None:
+        if not ids:
+            return
+        session.execute(
+            update(ScheduledSearch)
+            .where(ScheduledSearch.id.in_(ids), ScheduledSearch.status == STATUS_RUNNING)
+            .values(status=STATUS_PENDING, claimed_at=None)
+        )
+        session.commit()
+        logger.warning("scheduler_released_claims", count=len(ids))
 
     async def poll_downloads(self) -> None:
         started = time.monotonic()
-        now = datetime.utcnow()
+        now = _utcnow()
         waiting_completed = 0
         waiting_failed = 0
         manual_completed = 0
         manual_failed = 0
+        events: list[dict[str, str | None]] = []
         with SessionLocal() as session:
-            waiting_items = (
-                session.query(ScheduledSearch)
-                .join(Round, Round.id == ScheduledSearch.round_id)
-                .join(Season, Season.id == Round.season_id)
-                .filter(Season.is_deleted.is_(False))
-                .filter(ScheduledSearch.status == STATUS_WAITING)
-                .all()
+            # Read-only pass: plain rows skip ORM hydration; writes go through bulk UPDATEs below.
+            waiting_items = session.execute(_WAITING_STMT).all()
+            manual_pending = list_manual_pending(session)
+            # One IN query for every downloader the waiting and manual items reference, instead of one per id.
+            downloader_ids = {item.downloader_id for item in waiting_items if item.downloader_id}
+            downloader_ids.update(p["downloader_id"] for p in manual_pending if p["downloader_id"])
+            downloaders: dict[int, Downloader] = {}
+            if downloader_ids:
+                downloaders = {
+                    d.id: d
+                    for d in session.query(Downloader)
+                    .filter(Downloader.id.in_(downloader_ids))
+                    .filter_by(enabled=True)
+                    .all()
+                }
+            # One history fetch per downloader per pass, shared by the waiting and manual loops and
+            # sized so every tag tracked on that downloader fits in it.
+            tracked_per_downloader = Counter(item.downloader_id for item in waiting_items if item.downloader_id)
+            tracked_per_downloader.update(p["downloader_id"] for p in manual_pending if p["downloader_id"])
+            history_cache = await self._fetch_history_indexes(
+                [downloaders[d_id] for d_id in tracked_per_downloader if downloaders.get(d_id)],
+                {d_id: max(80, 2 * count) for d_id, count in tracked_per_downloader.items()},
             )
-            downloader_cache: dict[int, Downloader | None] = {}
+            # Status changes are collected and written as one executemany UPDATE after the loop.
+            transitions: list[dict] = []
+            tag_backfill: list[dict] = []
             for item in waiting_items:
-                tag = self._ensure_tag(item)
+                tag = item.tag or self._default_tag(item.round_id, item.event_type)
+                if not item.tag:
+                    tag_backfill.append({"id": item.id, "tag": tag})
                 downloader_id = item.downloader_id
                 if not downloader_id:
-                    item.status = STATUS_FAILED
-                    item.last_error = "Missing downloader"
-                    item.next_run_at = self._compute_next_run(item.event_start_utc, now)
+                    transitions.append(
+                        {
+                            "id": item.id,
+                            "status": STATUS_FAILED,
+                            "last_error": "Missing downloader",
+                            "next_run_at": self._compute_next_run(item.event_start_utc, now),
+                        }
+                    )
                     waiting_failed += 1
                     logger.warning("scheduler_poll_missing_downloader", search_id=item.id, tag=tag, round_id=item.round_id)
                     continue
 
-                downloader = downloader_cache.get(downloader_id)
-                if downloader is None:
-                    downloader = session.query(Downloader).filter_by(id=downloader_id, enabled=True).first()
-                    downloader_cache[downloader_id] = downloader
+                downloader = downloaders.get(downloader_id)
                 if not downloader:
-                    item.status = STATUS_FAILED
-                    item.last_error = "Downloader not available"
-                    item.next_run_at = self._compute_next_run(item.event_start_utc, now)
+                    transitions.append(
+                        {
+                            "id": item.id,
+                            "status": STATUS_FAILED,
+                            "last_error": "Downloader not available",
+                            "next_run_at": self._compute_next_run(item.event_start_utc, now),
+                        }
+                    )
                     waiting_failed += 1
                     logger.warning(
                         "scheduler_poll_downloader_unavailable",
@@ -199,17 +525,16 @@ class SchedulerService:
                         downloader_id=downloader_id,
                     )
                     continue
-                history = list_history(downloader, limit=80)
-                match = next((row for row in history if tag.lower() in (row.get("name") or "").lower()), None)
+                match = history_cache[downloader.id].get(tag.lower())
                 if not match:
                     continue
 
                 status = (match.get("status") or "").lower()
-                if status in {"completed", "success", "ok"}:
-                    item.status = STATUS_COMPLETED
-                    item.last_error = None
-                    item.next_run_at = None
-                    self._notify_event(session, event="download-complete", title=item.nzb_title or tag, downloader=downloader)
+                if status in _DONE_STATES:
+                    transitions.append(
+                        {"id": item.id, "status": STATUS_COMPLETED, "last_error": None, "next_run_at": None}
+                    )
+                    self._queue_event(events, event="download-complete", title=item.nzb_title or tag, downloader=downloader)
                     waiting_completed += 1
                     logger.info(
                         "scheduler_poll_waiting_complete",
@@ -219,16 +544,21 @@ class SchedulerService:
                         downloader_id=downloader.id,
                         title=item.nzb_title or tag,
                     )
-                elif status in {"failed", "failure", "error"}:
-                    item.status = STATUS_FAILED
-                    item.last_error = "Downloader reported failure"
-                    item.next_run_at = self._compute_next_run(item.event_start_utc, now)
-                    self._notify_event(
-                        session,
+                elif status in _FAILED_STATES:
+                    transitions.append(
+                        {
+                            "id": item.id,
+                            "status": STATUS_FAILED,
+                            "last_error": "Downloader reported failure",
+                            "next_run_at": self._compute_next_run(item.event_start_utc, now),
+                        }
+                    )
+                    self._queue_event(
+                        events,
                         event="download-fail",
                         title=item.nzb_title or tag,
                         downloader=downloader,
-                        reason=item.last_error,
+                        reason="Downloader reported failure",
                     )
                     waiting_failed += 1
                     logger.warning(
@@ -240,8 +570,12 @@ class SchedulerService:
                         title=item.nzb_title or tag,
                     )
 
+            if transitions:
+                session.execute(update(ScheduledSearch), transitions)
+            if tag_backfill:
+                session.execute(update(ScheduledSearch), tag_backfill)
+
             # Handle manual sends tagged with rc-manual-*
-            manual_pending = list_manual_pending(session)
             for pending in manual_pending:
                 downloader_id = pending.get("downloader_id")
                 tag = str(pending.get("tag") or "").lower()
@@ -252,10 +586,7 @@ class SchedulerService:
                     logger.warning("scheduler_poll_manual_missing_downloader", tag=tag, title=title)
                     continue
 
-                downloader = downloader_cache.get(downloader_id)
-                if downloader is None:
-                    downloader = session.query(Downloader).filter_by(id=downloader_id, enabled=True).first()
-                    downloader_cache[downloader_id] = downloader
+                downloader = downloaders.get(downloader_id)
                 if not downloader:
                     update_manual_status(session, tag=tag, status=MANUAL_FAILED, last_error="Downloader not available")
                     manual_failed += 1
@@ -264,15 +595,14 @@ class SchedulerService:
                     )
                     continue
 
-                history = list_history(downloader, limit=80)
-                match = next((row for row in history if tag in (row.get("name") or "").lower()), None)
+                match = history_cache[downloader.id].get(tag)
                 if not match:
                     continue
 
                 status = (match.get("status") or "").lower()
-                if status in {"completed", "success", "ok"}:
+                if status in _DONE_STATES:
                     update_manual_status(session, tag=tag, status=MANUAL_COMPLETED, last_error=None)
-                    self._notify_event(session, event="download-complete", title=title, downloader=downloader)
+                    self._queue_event(events, event="download-complete", title=title, downloader=downloader)
                     manual_completed += 1
                     logger.info(
                         "scheduler_poll_manual_complete",
@@ -281,10 +611,10 @@ class SchedulerService:
                         downloader_id=downloader.id,
                         downloader=downloader.name,
                     )
-                elif status in {"failed", "failure", "error"}:
+                elif status in _FAILED_STATES:
                     update_manual_status(session, tag=tag, status=MANUAL_FAILED, last_error="Downloader reported failure")
-                    self._notify_event(
-                        session,
+                    self._queue_event(
+                        events,
                         event="download-fail",
                         title=title,
                         downloader=downloader,
@@ -300,6 +630,7 @@ class SchedulerService:
                     )
 
             session.commit()
+            await self._flush_events(session, events)
         duration_ms = int((time.monotonic() - started) * 1000)
         logger.info(
             "scheduler_poll_complete",
@@ -312,49 +643,127 @@ class SchedulerService:
             duration_ms=duration_ms,
         )
 
+    def apply_download_callback(self, session: Session, downloader: Downloader, *, tag: str, status: str) -> str:
+        """Settle a waiting search or manual download from a downloader push; returns the outcome.
+
+        Blocking (DB and notification HTTP); callers run it in a worker thread.
+        """
+        tag = tag.strip().lower()
+        status = status.strip().lower()
+        if status not in _DONE_STATES and status not in _FAILED_STATES:
+            return "ignored"
+        now = _utcnow()
+        events: list[dict[str, str | None]] = []
+
+        item: ScheduledSearch | None = (
+            session.query(ScheduledSearch)
+            .filter_by(tag=tag, status=STATUS_WAITING, downloader_id=downloader.id)
+            .first()
+        )
+        if item:
+            title = item.nzb_title or tag
+            if status in _DONE_STATES:
+                item.status = STATUS_COMPLETED
+                item.last_error = None
+                item.next_run_at = None
+                self._queue_event(events, event="download-complete", title=title, downloader=downloader)
+                logger.info("scheduler_callback_waiting_complete", search_id=item.id, tag=tag, downloader_id=downloader.id)
+            else:
+                item.status = STATUS_FAILED
+                item.last_error = "Downloader reported failure"
+                item.next_run_at = self._compute_next_run(item.event_start_utc, now)
+                self._queue_event(
+                    events, event="download-fail", title=title, downloader=downloader, reason="Downloader reported failure"
+                )
+                logger.warning("scheduler_callback_waiting_failed", search_id=item.id, tag=tag, downloader_id=downloader.id)
+            session.commit()
+        else:
+            pending = get_manual_pending(session, tag)
+            if not pending or pending["downloader_id"] != downloader.id:
+                return "unknown tag"
+            title = pending["title"] or tag
+            if status in _DONE_STATES:
+                update_manual_status(session, tag=tag, status=MANUAL_COMPLETED, last_error=None)
+                self._queue_event(events, event="download-complete", title=title, downloader=downloader)
+                logger.info("scheduler_callback_manual_complete", tag=tag, downloader_id=downloader.id)
+            else:
+                update_manual_status(session, tag=tag, status=MANUAL_FAILED, last_error="Downloader reported failure")
+                self._queue_event(
+                    events, event="download-fail", title=title, downloader=downloader, reason="Downloader reported failure"
+                )
+                logger.warning("scheduler_callback_manual_failed", tag=tag, downloader_id=downloader.id)
+
+        self._dispatch_events(session, events)
+        return "completed" if status in _DONE_STATES else "failed"
+
+    async def _fetch_history_indexes(
+        self, downloaders: list[Downloader], limits: dict[int, int]
+    ) -> dict[int, dict[str, dict[str, str]]]:
+        """Fetch every downloader's history concurrently and index each by rc-* tag."""
+        histories = await asyncio.gather(
+            *(asyncio.to_thread(list_history, d, limit=limits.get(d.id, 80)) for d in downloaders)
+        )
+        return {d.id: index_history_tags(history) for d, history in zip(downloaders, histories)}
+
     def _event_start_time(self, round_obj: Round, event_type: str) -> Optional[datetime]:
-        target = event_type.lower()
-        for ev in round_obj.events or []:
-            if (ev.type or "").lower() == target:
-                return ev.start_time_utc
-        return None
+        return _events_by_type(round_obj).get(event_type.lower())
 
     def _compute_next_run(self, event_start: Optional[datetime], now: datetime) -> datetime:
         if event_start is None:
-            return now + timedelta(hours=6)
-        anchor = event_start + timedelta(minutes=30)
+            return now + _T6H
+        anchor = event_start + _T30M
         if now < anchor:
             return anchor
         elapsed = now - event_start
-        if elapsed <= timedelta(hours=48):
-            return now + timedelta(minutes=10)
-        if elapsed <= timedelta(hours=168):
-            return now + timedelta(hours=6)
-        return now + timedelta(hours=24)
+        if elapsed <= _T48H:
+            return now + _T10M
+        if elapsed <= _T168H:
+            return now + _T6H
+        return now + _T24H
+
+    def _default_tag(self, round_id: int, event_type: str) -> str:
+        return f"{_TAG_PREFIX}{round_id}-{event_type.lower()}"
 
     def _ensure_tag(self, item: ScheduledSearch) -> str:
         if item.tag:
             return item.tag
-        tag = f"rc-{item.round_id}-{item.event_type.lower()}"
+        tag = self._default_tag(item.round_id, item.event_type)
         item.tag = tag
         return tag
 
+    def _before_start_window(self, item: ScheduledSearch, now: datetime) -> bool:
+        return item.event_start_utc is not None and now < item.event_start_utc + _T30M
+
+    def _load_enabled_clients(self, session: Session) -> tuple[list[Indexer], list[Downloader]]:
+        """Enabled indexers (by name) and downloaders (by id) shared by every search in a tick."""
+        indexers = session.query(Indexer).filter_by(enabled=True).order_by(Indexer.name.asc()).all()
+        downloaders = session.query(Downloader).filter_by(enabled=True).order_by(Downloader.id.asc()).all()
+        return indexers, downloaders
+
     def _pick_best(self, results: list, threshold: int) -> Optional:
-        best = None
-        for r in results:
-            if r.score is None or r.score < threshold:
-                continue
-            if best is None or (r.score or 0) > (best.score or 0):
-                best = r
-        return best
-
-    async def _run_single(self, session: Session, item: ScheduledSearch, now: datetime) -> None:
-        round_obj: Round | None = (
-            session.query(Round)
-            .options(selectinload(Round.events), selectinload(Round.season))
-            .filter_by(id=item.round_id)
-            .first()
-        )
+        candidates = [r for r in results if r.score is not None and r.score >= threshold]
+        # max() keeps the first of equal scores, same as the strict > comparison did.
+        return max(candidates, key=_SCORE, default=None)
+
+    async def _run_single(
+        self,
+        session: Session,
+        item: ScheduledSearch,
+        round_obj: Round | None,
+        cfg: SearchSettings,
+        indexers: list[Indexer],
+        downloaders: list[Downloader],
+        now: datetime,
+        events: list[dict[str, str | None]],
+        force: bool = False,
+    ) -> None:
+        # Common "not time yet" path: decided from the stored start alone, no round needed.
+        if self._before_start_window(item, now):
+            item.status = STATUS_PENDING
+            item.next_run_at = self._compute_next_run(item.event_start_utc, now)
+            item.last_error = None
+            return
+
         if not round_obj:
             item.status = STATUS_FAILED
             item.last_error = "Round not found"
@@ -370,13 +779,12 @@ class SchedulerService:
         event_start = item.event_start_utc or self._event_start_time(round_obj, item.event_type)
         item.event_start_utc = event_start
         next_due = self._compute_next_run(event_start, now)
-        if event_start and now < event_start + timedelta(minutes=30):
+        if event_start and now < event_start + _T30M:
             item.status = STATUS_PENDING
             item.next_run_at = next_due
             item.last_error = None
             return
 
-        cfg = get_search_settings(session)
         allowlist = set(cfg.event_allowlist or [])
         if allowlist and item.event_type.lower() not in allowlist:
             item.status = STATUS_PENDING
@@ -384,12 +792,6 @@ class SchedulerService:
             item.last_error = "Event type disallowed"
             return
 
-        indexers: Iterable[Indexer] = (
-            session.query(Indexer)
-            .filter_by(enabled=True)
-            .order_by(Indexer.name.asc())
-            .all()
-        )
         if not indexers:
             item.status = STATUS_FAILED
             item.last_error = "No enabled indexers"
@@ -399,7 +801,16 @@ class SchedulerService:
         item.status = STATUS_RUNNING
         item.last_searched_at = now
         item.attempts = (item.attempts or 0) + 1
-        results = _search_round_events(round_obj.season, round_obj, list(indexers), {item.event_type.lower()}, limit_per_query=50)
+        # The indexer fan-out is blocking HTTP (already parallel per indexer); keep it off the event loop.
+        results = await asyncio.to_thread(
+            _search_round_cached,
+            round_obj.season,
+            round_obj,
+            indexers,
+            {item.event_type.lower()},
+            limit_per_query=50,
+            use_cache=not force,
+        )
         if not results:
             item.status = STATUS_PENDING
             item.last_error = "No results"
@@ -427,9 +838,9 @@ class SchedulerService:
 
         downloader: Downloader | None = None
         if item.downloader_id:
-            downloader = session.query(Downloader).filter_by(id=item.downloader_id, enabled=True).first()
-        if not downloader:
-            downloader = session.query(Downloader).filter_by(enabled=True).order_by(Downloader.id.asc()).first()
+            downloader = next((d for d in downloaders if d.id == item.downloader_id), None)
+        if not downloader and downloaders:
+            downloader = downloaders[0]
         if not downloader:
             item.status = STATUS_FAILED
             item.last_error = "No enabled downloaders"
@@ -449,7 +860,8 @@ class SchedulerService:
             priority=downloader.priority,
             category=downloader.category,
         )
-        ok, message = send_to_downloader(
+        ok, message = await asyncio.to_thread(
+            send_to_downloader,
             downloader,
             nzb_url=best.nzb_url,
             title=title_with_tag,
@@ -462,8 +874,8 @@ class SchedulerService:
             item.nzb_url = best.nzb_url
             item.downloader_id = downloader.id
             item.last_error = None
-            item.next_run_at = now + timedelta(hours=6)  # safety retry window while waiting
-            self._notify_event(session, event="download-start", title=best.title, downloader=downloader)
+            item.next_run_at = now + _T6H  # safety retry window while waiting
+            self._queue_event(events, event="download-start", title=best.title, downloader=downloader)
             logger.info(
                 "Scheduler send ok",
                 downloader=downloader.name,
@@ -488,15 +900,15 @@ class SchedulerService:
                 error=message,
             )
 
-    def list_searches(self, session: Session) -> list[ScheduledSearch]:
-        return (
-            session.query(ScheduledSearch)
-            .join(Round, Round.id == ScheduledSearch.round_id)
-            .join(Season, Season.id == Round.season_id)
-            .filter(Season.is_deleted.is_(False))
-            .order_by(ScheduledSearch.next_run_at.asc().nullsfirst(), ScheduledSearch.added_at.asc())
-            .all()
-        )
+    def list_searches(
+        self, session: Session, *, limit: int | None = None, offset: int = 0
+    ) -> list[ScheduledSearch]:
+        stmt = _LIST_STMT
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(session.scalars(stmt))
 
     def create_search(self, session: Session, payload: ScheduledSearchCreate) -> ScheduledSearch:
         existing = (
@@ -514,13 +926,8 @@ class SchedulerService:
         )
         if not round_obj:
             raise ValueError("Round not found or season hidden")
-        event_start = None
-        if round_obj:
-            for ev in round_obj.events or []:
-                if (ev.type or "").lower() == payload.event_type.lower():
-                    event_start = ev.start_time_utc
-                    break
-        now = datetime.utcnow()
+        event_start = self._event_start_time(round_obj, payload.event_type)
+        now = _utcnow()
         next_run = self._compute_next_run(event_start, now)
         item = ScheduledSearch(
             round_id=payload.round_id,
@@ -533,11 +940,11 @@ class SchedulerService:
         )
         session.add(item)
         session.commit()
-        session.refresh(item)
+        self.wake()
         return item
 
     def compute_next_run(self, event_start: Optional[datetime], now: Optional[datetime] = None) -> datetime:
-        return self._compute_next_run(event_start, now or datetime.utcnow())
+        return self._compute_next_run(event_start, now or _utcnow())
 
     def update_search(
         self,
@@ -555,7 +962,7 @@ class SchedulerService:
         if not item:
             return None
 
-        now = datetime.utcnow()
+        now = _utcnow()
 
         if downloader_id is not None:
             item.downloader_id = downloader_id
@@ -573,16 +980,20 @@ class SchedulerService:
             normalized = status.lower()
             if normalized not in {STATUS_PENDING, STATUS_PAUSED}:
                 raise ValueError("Invalid status")
-            item.status = normalized
-            item.last_error = None
-            if normalized == STATUS_PAUSED:
-                item.next_run_at = None
-            else:
-                next_due = self._compute_next_run(item.event_start_utc, now)
-                item.next_run_at = next_due
+            next_due = None if normalized == STATUS_PAUSED else self._compute_next_run(item.event_start_utc, now)
+            # Guarded like the claim so a run in flight is never flipped underneath the worker that owns it.
+            changed = session.execute(
+                update(ScheduledSearch)
+                .where(ScheduledSearch.id == search_id, ScheduledSearch.status != STATUS_RUNNING)
+                .values(status=normalized, last_error=None, next_run_at=next_due)
+            ).rowcount
+            if not changed:
+                session.rollback()
+                raise HTTPException(status_code=http_status.HTTP_409_CONFLICT, detail="Scheduled search is running")
 
         session.commit()
         session.refresh(item)
+        self.wake()
         return item
 
     def delete_search(self, session: Session, search_id: int) -> bool:
@@ -593,11 +1004,31 @@ class SchedulerService:
         session.commit()
         return True
 
-    async def run_now(self, search_id: int) -> None:
-        now = datetime.utcnow()
+    async def run_now(self, search_id: int) -> bool:
+        """Run one search immediately; False when it is already claimed by a tick or another manual run."""
+        now = _utcnow()
         with SessionLocal() as session:
-            item: ScheduledSearch | None = session.query(ScheduledSearch).filter_by(id=search_id).first()
-            if not item:
-                return
-            await self._run_single(session, item, now)
+            claimed = session.execute(
+                update(ScheduledSearch)
+                .where(ScheduledSearch.id == search_id, ScheduledSearch.status != STATUS_RUNNING)
+                .values(status=STATUS_RUNNING, claimed_at=now)
+                .returning(ScheduledSearch.id)
+            ).scalar()
             session.commit()
+            if claimed is None:
+                return False
+            try:
+                item: ScheduledSearch = session.query(ScheduledSearch).filter_by(id=search_id).one()
+                round_obj = batch_fetch_rounds(session, [item.round_id]).get(item.round_id)
+                indexers, downloaders = self._load_enabled_clients(session)
+                events: list[dict[str, str | None]] = []
+                await self._run_single(
+                    session, item, round_obj, get_search_settings(session), indexers, downloaders, now, events, force=True
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                self._release_claims(session, [search_id])
+                raise
+            await self._flush_events(session, events)
+            return True
@@ -1,6 +1,4 @@
 import os
-import tempfile
-from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,8 +7,7 @@ from fastapi.testclient import TestClient
 # Configure environment once for the test session.
 def _configure_env() -> None:
     os.environ.setdefault("ENABLE_SCHEDULER", "false")
-    sandbox_dir = Path(tempfile.mkdtemp(prefix="racecarr-test-"))
-    os.environ.setdefault("SQLITE_PATH", str(sandbox_dir / "test.db"))
+    os.environ.setdefault("SQLITE_PATH", ":memory:")
 
 
 _configure_env()
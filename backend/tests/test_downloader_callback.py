@@ -0,0 +1,104 @@
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app.core.database import SessionLocal
+from app.models.entities import Downloader, ScheduledSearch
+from app.services.manual_downloads import record_manual_download
+from app.services.scheduler import _utcnow
+
+_KEY = "sab-api-key"
+
+
+@pytest.fixture()
+def downloader(monkeypatch):
+    monkeypatch.setattr("app.services.scheduler.list_notification_targets", lambda _s: [])
+    monkeypatch.setattr("app.api.routes._SEEN_CALLBACKS", {})
+    with SessionLocal() as session:
+        item = Downloader(name="SAB", type="sabnzbd", api_url="http://sab.local", api_key=_KEY, enabled=True)
+        session.add(item)
+        session.commit()
+        yield item
+        session.query(ScheduledSearch).delete()
+        if inspect(session.bind).has_table("manual_download"):
+            session.execute(text("DELETE FROM manual_download"))
+        session.delete(item)
+        session.commit()
+
+
+def _post(client, downloader_id: int, payload: dict, key: str = _KEY):
+    body = json.dumps({"timestamp": int(time.time()), **payload}).encode()
+    signature = hmac.new(key.encode(), body, hashlib.sha256).hexdigest()
+    return client.post(
+        f"/api/downloaders/{downloader_id}/callback",
+        content=body,
+        headers={"content-type": "application/json", "X-Racecarr-Signature": f"sha256={signature}"},
+    )
+
+
+def test_callback_completes_waiting_search(client, downloader):
+    with SessionLocal() as session:
+        item = ScheduledSearch(
+            round_id=1,
+            event_type="sprint qualifying",
+            status="waiting-download",
+            added_at=_utcnow(),
+            tag="rc-1-sprint qualifying",
+            downloader_id=downloader.id,
+        )
+        session.add(item)
+        session.commit()
+        search_id = item.id
+
+    resp = _post(client, downloader.id, {"tag": "RC-1-Sprint Qualifying", "status": "Completed"})
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True, "message": "completed"}
+    with SessionLocal() as session:
+        assert session.get(ScheduledSearch, search_id).status == "completed"
+
+
+def test_callback_rejects_bad_signature(client, downloader):
+    resp = _post(client, downloader.id, {"tag": "rc-1-race", "status": "completed"}, key="wrong")
+    assert resp.status_code == 401
+
+
+def test_callback_unknown_tag(client, downloader):
+    resp = _post(client, downloader.id, {"tag": "rc-99-race", "status": "completed"})
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": False, "message": "unknown tag"}
+
+
+def test_callback_fails_manual_download(client, downloader):
+    with SessionLocal() as session:
+        record_manual_download(session, tag="rc-manual-abc", title="F1 Race", downloader_id=downloader.id)
+        session.commit()
+
+    resp = _post(client, downloader.id, {"tag": "rc-manual-abc", "status": "failed"})
+    assert resp.json() == {"ok": True, "message": "failed"}
+    with SessionLocal() as session:
+        row = session.execute(text("SELECT status, last_error FROM manual_download WHERE tag = 'rc-manual-abc'")).one()
+    assert tuple(row) == ("failed", "Downloader reported failure")
+
+
+def test_callback_unknown_id_looks_like_bad_signature(client, downloader):
+    known = _post(client, downloader.id, {"tag": "rc-1-race", "status": "completed"}, key="wrong")
+    unknown = _post(client, downloader.id + 1000, {"tag": "rc-1-race", "status": "completed"}, key="wrong")
+    assert unknown.status_code == known.status_code == 401
+    assert unknown.json() == known.json()
+
+
+def test_callback_rejects_replay(client, downloader):
+    payload = {"tag": "rc-99-race", "status": "completed", "timestamp": int(time.time())}
+    assert _post(client, downloader.id, payload).status_code == 200
+    resp = _post(client, downloader.id, payload)
+    assert resp.status_code == 401
+    assert resp.json() == {"detail": "Stale or replayed callback"}
+
+
+def test_callback_rejects_stale_timestamp(client, downloader):
+    resp = _post(client, downloader.id, {"tag": "rc-99-race", "status": "completed", "timestamp": int(time.time()) - 3600})
+    assert resp.status_code == 401
@@ -0,0 +1,45 @@
+from app.models.entities import Downloader
+from app.services import downloader_client
+
+
+def _fake_fetch(monkeypatch, rows: int) -> list[int]:
+    calls = []
+
+    def fetch(downloader, limit):
+        calls.append(limit)
+        return [{"name": f"job {i}"} for i in range(min(limit, rows))]
+
+    monkeypatch.setattr(downloader_client, "_list_sabnzbd_history", fetch)
+    monkeypatch.setattr(downloader_client, "_HISTORY_CACHE", {})
+    monkeypatch.setattr(downloader_client, "_HISTORY_LOCKS", {})
+    return calls
+
+
+def _downloader(downloader_id: int = 1) -> Downloader:
+    return Downloader(id=downloader_id, name="sab", type="sabnzbd", api_url="http://sab.local")
+
+
+def test_history_smaller_limit_sliced_from_cache(monkeypatch):
+    calls = _fake_fetch(monkeypatch, rows=100)
+    assert len(downloader_client.list_history(_downloader(), limit=50)) == 50
+    assert len(downloader_client.list_history(_downloader(), limit=10)) == 10
+    assert len(downloader_client.list_history(_downloader(), limit=80)) == 80
+    assert calls == [50, 80]
+    assert list(downloader_client._HISTORY_CACHE) == [1]
+
+
+def test_history_short_page_covers_larger_limit(monkeypatch):
+    calls = _fake_fetch(monkeypatch, rows=5)
+    downloader_client.list_history(_downloader(), limit=10)
+    assert len(downloader_client.list_history(_downloader(), limit=50)) == 5
+    assert calls == [10]
+
+
+def test_history_write_evicts_expired_entries(monkeypatch):
+    _fake_fetch(monkeypatch, rows=5)
+    downloader_client.list_history(_downloader(1))
+    fetched_at, limit, history = downloader_client._HISTORY_CACHE[1]
+    downloader_client._HISTORY_CACHE[1] = (fetched_at - downloader_client._HISTORY_TTL_SECONDS, limit, history)
+    downloader_client.list_history(_downloader(2))
+    assert list(downloader_client._HISTORY_CACHE) == [2]
+    assert list(downloader_client._HISTORY_LOCKS) == [2]
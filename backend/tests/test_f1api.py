@@ -0,0 +1,59 @@
+import httpx
+
+from app.services import f1api
+
+_RACES = b'{"races": [{"round": 1, "raceName": "Bahrain Grand Prix"}]}'
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_fetch_races_parses_json_and_etag(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "If-None-Match" not in request.headers
+        return httpx.Response(200, content=_RACES, headers={"content-type": "application/json", "ETag": '"v1"'})
+
+    monkeypatch.setattr(f1api, "_CLIENT", _client(handler))
+    status_code, etag, races = f1api._fetch_races("http://f1api.local/api/2025", None)
+    assert status_code == 200
+    assert etag == '"v1"'
+    assert races == [{"round": 1, "raceName": "Bahrain Grand Prix"}]
+
+
+def test_fetch_races_not_modified(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["If-None-Match"] == '"v1"'
+        return httpx.Response(304)
+
+    monkeypatch.setattr(f1api, "_CLIENT", _client(handler))
+    assert f1api._fetch_races("http://f1api.local/api/2025", '"v1"') == (304, '"v1"', None)
+
+
+def test_refresh_refetches_season_parsed_by_older_version(monkeypatch):
+    from app.core.database import SessionLocal
+    from app.models.entities import Round, Season
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=_RACES, headers={"content-type": "application/json", "ETag": '"v1"'})
+
+    monkeypatch.setattr(f1api, "_CLIENT", _client(handler))
+    with SessionLocal() as session:
+        session.add(Season(year=2042, etag='"v1"'))
+        session.commit()
+        try:
+            season = f1api.refresh_season(session, 2042)
+            assert season.etag == f'{f1api._ETAG_PREFIX}"v1"'
+            assert [r.name for r in season.rounds] == ["Bahrain Grand Prix"]
+            f1api.refresh_season(session, 2042)
+            assert sent == [None, '"v1"']
+        finally:
+            session.rollback()
+            session.query(Round).delete()
+            session.query(Season).delete()
+            session.commit()
@@ -0,0 +1,51 @@
+import httpx
+
+from app.models.entities import Indexer
+from app.services import indexer_client
+
+_CAPS = b'<?xml version="1.0"?><caps><server title="test"/></caps>'
+
+
+def _client(search_body: bytes) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"content-type": "application/xml"}
+        if request.url.params.get("t") == "caps":
+            return httpx.Response(200, content=_CAPS, headers=headers)
+        return httpx.Response(200, content=search_body, headers=headers)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _indexer() -> Indexer:
+    return Indexer(name="test", api_url="http://indexer.local", api_key="wrong")
+
+
+def test_connection_checks_key_with_search_even_when_caps_succeeds(monkeypatch):
+    monkeypatch.setattr(indexer_client, "_CLIENT", _client(b'<error code="100" description="Incorrect user credentials"/>'))
+    ok, message = indexer_client.test_indexer_connection(_indexer())
+    assert ok is False
+    assert "API key" in message
+
+
+def test_connection_ok_when_search_accepts_key(monkeypatch):
+    monkeypatch.setattr(indexer_client, "_CLIENT", _client(b"<rss><channel><item><title>F1</title></item></channel></rss>"))
+    ok, message = indexer_client.test_indexer_connection(_indexer())
+    assert ok is True
+    assert message == "Caps retrieved"
+
+
+def test_search_use_cache_false_refetches(monkeypatch):
+    hits = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url)
+        return httpx.Response(200, content=b"<rss><channel><item><title>F1 Race</title></item></channel></rss>")
+
+    monkeypatch.setattr(indexer_client, "_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    indexer_client.clear_search_cache()
+    indexer = _indexer()
+    indexer_client.search_indexer(indexer, "f1 cache test")
+    indexer_client.search_indexer(indexer, "f1 cache test")
+    assert len(hits) == 1
+    indexer_client.search_indexer(indexer, "f1 cache test", use_cache=False)
+    assert len(hits) == 2
@@ -78,3 +78,29 @@ def test_notifications_test_single(client, monkeypatch):
     # Invalid index should 404
     resp = client.post("/api/notifications/test/5")
     assert resp.status_code == 404
+
+
+def test_manual_send_uses_event_envelope(client, monkeypatch):
+    from app.core.database import SessionLocal
+    from app.models.entities import Downloader
+
+    _login(client)
+    with SessionLocal() as session:
+        downloader = Downloader(name="SAB", type="sabnzbd", api_url="http://sab.local", api_key="k", enabled=True)
+        session.add(downloader)
+        session.commit()
+        downloader_id = downloader.id
+
+    called = {}
+    monkeypatch.setattr("app.api.routes.send_to_downloader", lambda *_a, **_k: (True, "queued"))
+    monkeypatch.setattr("app.api.routes.list_notification_targets", lambda _s: [{"type": "webhook", "url": "http://hook"}])
+    monkeypatch.setattr("app.api.routes.send_notifications", lambda _t, **kwargs: called.update(kwargs))
+    try:
+        resp = client.post(f"/api/downloaders/{downloader_id}/send", json={"nzb_url": "http://x/nzb", "title": "F1 Race"})
+        assert resp.json()["ok"] is True
+        entry = {"title": "F1 Race", "downloader": "SAB", "reason": None}
+        assert called["data"] == {**entry, "events": [entry]}
+    finally:
+        with SessionLocal() as session:
+            session.query(Downloader).filter_by(id=downloader_id).delete()
+            session.commit()
@@ -0,0 +1,240 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.entities import Round, ScheduledSearch, Season
+from app.services.scheduler import SchedulerService, _utcnow, index_history_tags
+
+
+@pytest.fixture()
+def db():
+    with SessionLocal() as session:
+        yield session
+        session.rollback()
+        session.query(ScheduledSearch).delete()
+        session.query(Round).delete()
+        session.query(Season).delete()
+        session.commit()
+
+
+def _search(round_id: int, event_type: str, **fields) -> ScheduledSearch:
+    return ScheduledSearch(round_id=round_id, event_type=event_type, added_at=_utcnow(), **fields)
+
+
+def test_index_history_tags_keeps_full_bracketed_tag():
+    history = [
+        {"name": "F1 Sprint Qualifying 1080p [rc-7-sprint qualifying]", "status": "Completed"},
+        {"name": "F1 Sprint 1080p [rc-7-sprint]", "status": "Failed"},
+        {"name": "F1 Race 1080p [rc-7-race]", "status": "Completed"},
+    ]
+    by_tag = index_history_tags(history)
+    assert by_tag["rc-7-sprint qualifying"]["status"] == "Completed"
+    assert by_tag["rc-7-sprint"]["status"] == "Failed"
+    assert by_tag["rc-7-race"]["status"] == "Completed"
+
+
+def test_index_history_tags_first_row_wins():
+    history = [
+        {"name": "Newer [rc-3-race]", "status": "Completed"},
+        {"name": "Older [rc-3-race]", "status": "Failed"},
+        {"name": None, "status": "Completed"},
+    ]
+    assert index_history_tags(history) == {"rc-3-race": history[0]}
+
+
+def test_index_history_tags_matches_case_insensitively():
+    history = [{"name": "Race Replay [RC-12-Race]", "status": "Completed"}]
+    assert set(index_history_tags(history)) == {"rc-12-race"}
+
+
+def test_run_due_next_wake_ignores_orphaned_searches(db):
+    now = _utcnow()
+    season = Season(year=2031)
+    db.add(season)
+    db.flush()
+    round_obj = Round(season_id=season.id, round_number=1, name="Test GP")
+    db.add(round_obj)
+    db.flush()
+    later = now + timedelta(hours=3)
+    db.add(_search(round_obj.id, "race", status="pending", next_run_at=later))
+    # Round deleted out from under it: run_due can never claim this row.
+    db.add(_search(round_obj.id + 1000, "race", status="pending", next_run_at=now - timedelta(hours=1)))
+    db.commit()
+
+    next_wake = asyncio.run(SchedulerService().run_due())
+    assert next_wake == later
+
+
+def _due_search(db, year: int) -> ScheduledSearch:
+    season = Season(year=year)
+    db.add(season)
+    db.flush()
+    round_obj = Round(season_id=season.id, round_number=1, name="Test GP")
+    db.add(round_obj)
+    db.flush()
+    item = _search(round_obj.id, "race", status="pending", next_run_at=_utcnow() - timedelta(minutes=1))
+    db.add(item)
+    db.commit()
+    return item
+
+
+def test_claim_due_is_exclusive_and_stamps_lease(db):
+    item = _due_search(db, 2032)
+    svc = SchedulerService()
+    now = _utcnow()
+
+    claimed = svc._claim_due(db, now)
+    assert [row.id for row in claimed] == [item.id]
+    db.refresh(item)
+    assert item.status == "running"
+    assert item.claimed_at == now
+    assert svc._claim_due(db, now) == []
+
+
+def test_expire_claims_only_releases_expired_leases(db):
+    item = _due_search(db, 2033)
+    svc = SchedulerService()
+    now = _utcnow()
+    svc._claim_due(db, now)
+
+    svc._expire_claims(db, now + timedelta(minutes=5))
+    db.refresh(item)
+    assert item.status == "running"
+
+    svc._expire_claims(db, now + timedelta(hours=1))
+    db.refresh(item)
+    assert item.status == "pending"
+    assert item.claimed_at is None
+
+
+def test_run_due_releases_claims_when_tick_fails(db, monkeypatch):
+    item = _due_search(db, 2034)
+
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("settings unavailable")
+
+    monkeypatch.setattr("app.services.scheduler.get_search_settings", _boom)
+    with pytest.raises(RuntimeError):
+        asyncio.run(SchedulerService().run_due())
+    db.refresh(item)
+    assert item.status == "pending"
+    assert item.claimed_at is None
+
+
+def test_flush_events_sends_one_payload_shape(monkeypatch):
+    calls = []
+    monkeypatch.setattr("app.services.scheduler.list_notification_targets", lambda _s: [{"type": "webhook", "url": "http://hook"}])
+    monkeypatch.setattr("app.services.scheduler.send_notifications", lambda _t, **kwargs: calls.append(kwargs))
+    svc = SchedulerService()
+    events: list = []
+    svc._queue_event(events, event="download-complete", title="Race")
+    svc._queue_event(events, event="download-fail", title="Sprint", reason="Downloader reported failure")
+    svc._queue_event(events, event="download-fail", title="FP1", reason="Downloader reported failure")
+    asyncio.run(svc._flush_events(None, events))
+
+    by_event = {call["event"]: call["data"] for call in calls}
+    entry = {"title": "Race", "downloader": None, "reason": None}
+    assert by_event["download-complete"] == {**entry, "events": [entry]}
+    assert [e["title"] for e in by_event["download-fail"]["events"]] == ["Sprint", "FP1"]
+
+
+def test_round_search_cache_bypassed_when_forced(monkeypatch):
+    from app.services import scheduler
+
+    calls = []
+
+    def _fake_search(season, round_obj, indexers, event_types, limit_per_query, use_cache=True):
+        calls.append(use_cache)
+        return []
+
+    monkeypatch.setattr(scheduler, "_search_round_events", _fake_search)
+    season = Season(id=901, year=2040)
+    round_obj = Round(id=902, season_id=901, round_number=1, name="Cache GP")
+    args = (season, round_obj, [], {"race"})
+    scheduler._search_round_cached(*args, limit_per_query=50)
+    scheduler._search_round_cached(*args, limit_per_query=50)
+    scheduler._search_round_cached(*args, limit_per_query=50, use_cache=False)
+    assert calls == [True, False]
+
+
+def test_run_now_skips_search_claimed_by_a_tick(db):
+    item = _due_search(db, 2035)
+    svc = SchedulerService()
+    now = _utcnow()
+    svc._claim_due(db, now)
+
+    assert asyncio.run(svc.run_now(item.id)) is False
+    db.refresh(item)
+    assert item.status == "running"
+    assert item.claimed_at == now
+
+
+def test_run_now_claims_and_settles_search(db, monkeypatch):
+    item = _due_search(db, 2036)
+    monkeypatch.setattr("app.services.scheduler.list_notification_targets", lambda _s: [])
+
+    assert asyncio.run(SchedulerService().run_now(item.id)) is True
+    db.refresh(item)
+    assert item.status != "running"
+
+
+def test_update_search_leaves_running_search_alone(db):
+    from fastapi import HTTPException
+
+    item = _due_search(db, 2037)
+    svc = SchedulerService()
+    svc._claim_due(db, _utcnow())
+
+    with pytest.raises(HTTPException) as exc:
+        svc.update_search(db, item.id, status="paused")
+    assert exc.value.status_code == 409
+    db.refresh(item)
+    assert item.status == "running"
+
+
+def test_run_due_counts_runs_that_raised_as_failed(db, monkeypatch):
+    from app.services import scheduler
+
+    item = _due_search(db, 2038)
+    logged = {}
+
+    class _Logger:
+        def info(self, message, **fields):
+            logged[message] = fields
+
+        def error(self, message, **fields):
+            pass
+
+        warning = error
+
+    async def _boom(*_args, **_kwargs):
+        raise RuntimeError("indexer exploded")
+
+    monkeypatch.setattr(scheduler, "logger", _Logger())
+    monkeypatch.setattr(SchedulerService, "_run_single", _boom)
+    asyncio.run(SchedulerService().run_due())
+    db.refresh(item)
+    assert item.status == "failed"
+    assert logged["scheduler_run_due"]["failed"] == 1
+
+
+def test_clear_search_cache_drops_round_results(monkeypatch):
+    from app.services import scheduler
+    from app.services.indexer_client import clear_search_cache
+
+    calls = []
+
+    def _fake_search(season, round_obj, indexers, event_types, limit_per_query, use_cache=True):
+        calls.append(use_cache)
+        return []
+
+    monkeypatch.setattr(scheduler, "_search_round_events", _fake_search)
+    season = Season(id=903, year=2041)
+    round_obj = Round(id=904, season_id=903, round_number=1, name="Clear GP")
+    args = (season, round_obj, [], {"race"})
+    scheduler._search_round_cached(*args, limit_per_query=50)
+    clear_search_cache()
+    scheduler._search_round_cached(*args, limit_per_query=50)
+    assert calls == [True, True]
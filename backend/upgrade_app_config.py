@@ -17,15 +17,16 @@ def ensure_columns():
         ("default_downloader_id", "INTEGER"),
         ("event_allowlist", "VARCHAR"),
     ]
-    added = []
-    with eng.begin() as conn:
-        for col, typ in needed:
-            if col not in existing:
+    missing = [(col, typ) for col, typ in needed if col not in existing]
+    if missing:
+        # SQLite only takes one ADD COLUMN per ALTER; run them all in a single transaction.
+        with eng.begin() as conn:
+            for col, typ in missing:
                 conn.execute(text(f"ALTER TABLE app_config ADD COLUMN {col} {typ}"))
-                added.append(col)
+    added = [col for col, _ in missing]
     print("DB:", db)
     print("Added:", added)
-    print("Columns now:", [c.get("name") for c in inspect(eng).get_columns("app_config")])
+    print("Expected columns:", sorted(existing | set(added)))
 
 
 if __name__ == "__main__":